@@ -0,0 +1,61 @@
+"""Concurrent identical reads with and without request coalescing.
+
+Run with ``python benchmarks/bench_coalescing.py``. Simulates several agent
+sessions opening the same channel at once: every session reads the same
+history page and thread at the same moment, against a mock with 50 ms of
+latency.
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+
+from mock_slack import serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+SESSIONS = 32
+ROUNDS = 10
+
+
+async def run(coalesce: bool) -> None:
+    app_settings = slack_server.Settings.from_env()
+    app_settings.coalesce = coalesce
+    client = slack_server.create_slack_client(app_settings)
+    await client.start()
+    try:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            await asyncio.gather(*(
+                call
+                for _ in range(SESSIONS)
+                for call in (
+                    client.get_channel_history("C00000000", 10),
+                    client.get_thread_replies("C00000000", "1700000000.000000"),
+                )
+            ))
+        elapsed = time.perf_counter() - start
+        stats = client.coalesce_stats()
+        requests = stats["reads"] - stats["coalesced"]
+        print(f"coalesce={str(coalesce):<5}  {stats['reads']} reads -> {requests} HTTP requests   "
+              f"{elapsed / ROUNDS * 1000:7.1f} ms per round")
+    finally:
+        await client.aclose()
+
+
+async def main() -> None:
+    base_url, server = serve_in_thread(latency=0.05)
+    os.environ["SLACK_API_URL"] = base_url
+    try:
+        await run(False)
+        await run(True)
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Per-call latency of a fresh httpx client per call vs the shared pool.
+
+Run with ``python benchmarks/bench_connection_pool.py``. The mock server is
+plain HTTP on localhost, so the gap here only reflects TCP setup and client
+construction; against slack.com the TLS handshake widens it considerably.
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+# Measure connection reuse only, not client-side rate limiting
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+
+from mock_slack import serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+CALLS = 200
+
+
+def _report(label: str, samples: List[float]) -> None:
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<24} mean {statistics.mean(samples) * 1000:7.3f} ms   "
+          f"p50 {statistics.median(samples) * 1000:7.3f} ms   p95 {p95 * 1000:7.3f} ms")
+
+
+async def per_call_client(base_url: str) -> List[float]:
+    """The previous behaviour: one AsyncClient (and connection) per call"""
+    samples = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{base_url}/conversations.replies",
+                headers=slack_server.slack_client.bot_headers,
+                params={"channel": "C00000000", "ts": "1700000000.000000"}
+            )
+            response.json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def shared_client() -> List[float]:
+    client = slack_server.slack_client
+    await client.start()
+    samples = []
+    try:
+        for _ in range(CALLS):
+            start = time.perf_counter()
+            await client.get_thread_replies("C00000000", "1700000000.000000")
+            samples.append(time.perf_counter() - start)
+    finally:
+        await client.aclose()
+    return samples
+
+
+async def main() -> None:
+    base_url, server = serve_in_thread()
+    os.environ["SLACK_API_URL"] = base_url
+    slack_server.create_app()
+    try:
+        _report("per-call AsyncClient", await per_call_client(base_url))
+        _report("shared pooled client", await shared_client())
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+"""Payload size and encode time with and without field projection.
+
+Run with ``python benchmarks/bench_projection.py``.
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixtures import all_pages  # noqa: E402
+from pageless.projection import project_response  # noqa: E402
+
+ROUNDS = 50
+
+
+def main() -> None:
+    print(f"{'page':<28} {'mode':<10} {'bytes':>10} {'encode ms':>10}")
+    for label, page, key, fields in all_pages():
+        full = json.dumps(page)
+        projected = json.dumps(project_response(page, key, fields))
+        full_ms = timeit.timeit(lambda: json.dumps(page), number=ROUNDS) / ROUNDS * 1000
+        # Projection is part of the cost of the projected path
+        projected_ms = timeit.timeit(
+            lambda: json.dumps(project_response(page, key, fields)), number=ROUNDS
+        ) / ROUNDS * 1000
+        print(f"{label:<28} {'full':<10} {len(full):>10} {full_ms:>10.3f}")
+        print(f"{label:<28} {'projected':<10} {len(projected):>10} {projected_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
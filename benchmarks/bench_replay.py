@@ -0,0 +1,90 @@
+"""Replay a recorded Slack session through every read tool.
+
+Run with ``python benchmarks/bench_replay.py [--cassette PATH] [--speed S]``.
+Without an existing cassette one is first recorded against the mock Slack
+API with 50 ms of latency. The same tool calls are then replayed from the
+cassette, once at the recorded speed and once with no delay, so the second
+run measures only the server's own work (validation, caching, decoding and
+serialization) and can be compared across changes without network noise.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+from bench_tools import TOOL_ARGUMENTS  # noqa: E402
+from mock_slack import Dataset, serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+TOOLS = [
+    "slack_list_channels",
+    "slack_get_channel_history",
+    "slack_get_thread_replies",
+    "slack_get_threads_batch",
+    "slack_get_users",
+    "slack_get_user_profile",
+    "slack_list_all_channels",
+    "slack_list_all_users",
+]
+
+
+async def run_session(rounds: int) -> List[float]:
+    """Call each tool once per round; returns per-round wall time"""
+    app = slack_server.create_app()
+    timings = []
+    try:
+        async with create_connected_server_and_client_session(app._mcp_server) as client:
+            for i in range(rounds):
+                start = time.perf_counter()
+                for name in TOOLS:
+                    await client.call_tool(name, TOOL_ARGUMENTS[name](i))
+                timings.append(time.perf_counter() - start)
+    finally:
+        # Finalizes the cassette being recorded
+        await slack_server.shutdown()
+    return timings
+
+
+def report(label: str, timings: List[float]) -> None:
+    timings = sorted(timings)
+    print(f"{label:<24} {len(timings)} rounds   median {timings[len(timings) // 2] * 1000:8.1f} ms   "
+          f"total {sum(timings):6.2f} s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--cassette", help="Cassette to replay; recorded first when it does not exist")
+    parser.add_argument("--rounds", type=int, default=20, help="Sessions to record and replay (default 20)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Latency scale for the timed replay (default 1.0)")
+    args = parser.parse_args()
+    path = args.cassette or os.path.join(tempfile.mkdtemp(), "session.jsonl.gz")
+
+    if not os.path.exists(path):
+        base_url, server = serve_in_thread(0.05, dataset=Dataset(100, 200, 200, 20, realistic=True))
+        os.environ["SLACK_API_URL"] = base_url
+        os.environ["SLACK_CASSETTE_RECORD"] = path
+        try:
+            report("recorded (mock, 50 ms)", await run_session(args.rounds))
+        finally:
+            server.should_exit = True
+            del os.environ["SLACK_CASSETTE_RECORD"]
+        print(f"cassette: {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+
+    os.environ["SLACK_CASSETTE_REPLAY"] = path
+    for speed in (args.speed, 0):
+        os.environ["SLACK_CASSETTE_SPEED"] = str(speed)
+        report(f"replay speed={speed:g}", await run_session(args.rounds))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
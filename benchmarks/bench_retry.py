@@ -0,0 +1,145 @@
+"""Success rate and cost of the retry policy against a faulty mock Slack.
+
+Run with ``python benchmarks/bench_retry.py``. The mock answers 15% of
+requests with a non-JSON 503 and 5% with a 429. Reads should almost all
+succeed with retries on; chat.postMessage must reach the mock exactly once
+per post apart from 429 retries, since a 503 after sending is ambiguous and
+is never retried.
+
+The run ends with pass/fail checks over the in-process mock transport and
+exits non-zero if any fails: reads succeed under 503s and 429s, no
+chat.postMessage text reaches the mock twice, and 429s wait out
+Retry-After with and without the client-side rate limiter.
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+os.environ.setdefault("SLACK_RETRY_BASE_DELAY", "0.01")
+
+import httpx  # noqa: E402
+
+from mock_slack import Faults, mock_transport, serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+READS = 500
+POSTS = 100
+
+
+async def succeeded(call) -> bool:
+    try:
+        return bool((await call).get("ok"))
+    except Exception:
+        return False
+
+
+async def run(faults: Faults, retry_attempts: int) -> None:
+    for counter in (faults.requests, faults.rate_limited):
+        counter.clear()
+    app_settings = slack_server.Settings.from_env()
+    app_settings.retry_attempts = retry_attempts
+    app_settings.coalesce = False
+    client = slack_server.create_slack_client(app_settings)
+    await client.start()
+    try:
+        start = time.perf_counter()
+        reads = await asyncio.gather(*(
+            succeeded(client.get_thread_replies("C00000000", f"1700000000.{i:06d}")) for i in range(READS)
+        ))
+        posts = await asyncio.gather(*(succeeded(client.post_message("C00000000", f"post {i}")) for i in range(POSTS)))
+        elapsed = time.perf_counter() - start
+        sent = faults.requests["chat.postMessage"] - faults.rate_limited["chat.postMessage"]
+        print(f"retry_attempts={retry_attempts}  reads ok {sum(reads) / READS:6.1%}   "
+              f"posts ok {sum(posts) / POSTS:6.1%}   postMessage accepted {sent}/{POSTS}   {elapsed:5.2f} s")
+    finally:
+        await client.aclose()
+
+
+class PostCounter(httpx.AsyncBaseTransport):
+    """Counts chat.postMessage texts the mock accepted, i.e. did not answer with 429"""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+        self.texts: Counter = Counter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        if request.url.path.endswith("/chat.postMessage") and response.status_code != 429:
+            self.texts[json.loads(request.content)["text"]] += 1
+        return response
+
+
+def report(name: str, passed: bool, detail: str) -> bool:
+    print(f"{'PASS' if passed else 'FAIL'}  {name}: {detail}")
+    return passed
+
+
+async def check_faults() -> bool:
+    """Reads survive 503s and 429s; no post is sent twice"""
+    random.seed(15)
+    faults = Faults(error_rate=0.15, rate_limit_rate=0.05, retry_after=0)
+    transport = PostCounter(mock_transport(faults=faults))
+    app_settings = slack_server.Settings.from_env()
+    app_settings.coalesce = False
+    client = slack_server.create_slack_client(app_settings, transport)
+    try:
+        reads = await asyncio.gather(*(
+            succeeded(client.get_thread_replies("C00000000", f"1700000000.{i:06d}")) for i in range(READS)
+        ))
+        await asyncio.gather(*(succeeded(client.post_message("C00000000", f"post {i}")) for i in range(POSTS)))
+    finally:
+        await client.aclose()
+    duplicates = [text for text, count in transport.texts.items() if count > 1]
+    return all([
+        report("reads under 503/429", sum(reads) >= 0.99 * READS, f"{sum(reads)}/{READS} ok"),
+        report("postMessage sent at most once", not duplicates,
+               f"{len(transport.texts)} posts accepted, duplicated: {duplicates or 'none'}"),
+    ])
+
+
+async def check_retry_after(rate_limit: bool) -> bool:
+    """Every 429 is retried only after its Retry-After"""
+    retry_after = 1
+    app_settings = slack_server.Settings.from_env()
+    app_settings.rate_limit = rate_limit
+    transport = mock_transport(faults=Faults(rate_limit_rate=1.0, retry_after=retry_after))
+    client = slack_server.create_slack_client(app_settings, transport)
+    try:
+        start = time.perf_counter()
+        response = await client.get_thread_replies("C00000000", "1700000000.000000")
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.aclose()
+    expected = app_settings.rate_limit_retries * retry_after
+    return report(
+        f"Retry-After honoured (rate limiter {'on' if rate_limit else 'off'})",
+        elapsed >= expected and response.get("error") == "ratelimited",
+        f"{app_settings.rate_limit_retries} retries took {elapsed:.2f} s, expected >= {expected} s"
+    )
+
+
+async def main() -> None:
+    faults = Faults(error_rate=0.15, rate_limit_rate=0.05, retry_after=0)
+    base_url, server = serve_in_thread(faults=faults)
+    os.environ["SLACK_API_URL"] = base_url
+    try:
+        await run(faults, 0)
+        await run(faults, 3)
+    finally:
+        server.should_exit = True
+
+    results = [await check_faults(), await check_retry_after(False), await check_retry_after(True)]
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
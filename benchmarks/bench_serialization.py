@@ -0,0 +1,54 @@
+"""Micro-benchmarks for the JSON paths tool responses go through.
+
+Compares decoding Slack bodies and encoding tool results with the stdlib,
+orjson (when installed) and the raw-body passthrough used for unmodified
+responses. Run with ``python benchmarks/bench_serialization.py``.
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+
+from fixtures import all_pages  # noqa: E402
+from pageless.slack_server import JSONSerializer, SlackResponse  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ROUNDS = 100
+
+
+def _time(fn) -> float:
+    return timeit.timeit(fn, number=ROUNDS) / ROUNDS * 1000
+
+
+def main() -> None:
+    stdlib = JSONSerializer("json")
+    fast = JSONSerializer("orjson") if orjson is not None else None
+    if fast is None:
+        print("orjson not installed; only stdlib paths are measured")
+
+    print(f"{'page':<28} {'path':<24} {'ms':>8}")
+    for label, page, _, _ in all_pages():
+        body = json.dumps(page).encode()
+        response = SlackResponse(page, body)
+        rows = [
+            ("decode json", lambda: stdlib.loads(body)),
+            ("encode json", lambda: stdlib.dumps(dict(page))),
+            ("encode raw passthrough", lambda: stdlib.dumps(response)),
+        ]
+        if fast is not None:
+            rows[1:1] = [("decode orjson", lambda: fast.loads(body))]
+            rows[3:3] = [("encode orjson", lambda: fast.dumps(dict(page)))]
+        for name, fn in rows:
+            print(f"{label:<28} {name:<24} {_time(fn):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
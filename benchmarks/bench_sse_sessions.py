@@ -0,0 +1,87 @@
+"""Throughput of one SSE server process shared by many MCP client sessions.
+
+Starts the mock Slack API and the server in SSE mode in this process, then
+drives 1, 4 and 16 concurrent client sessions calling
+``slack_get_thread_replies``. All sessions share one connection pool, cache
+and rate limiter; client-side rate limiting is disabled here so the numbers
+show server throughput rather than Slack's limits.
+
+Run with ``python benchmarks/bench_sse_sessions.py``.
+"""
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+
+from mcp import ClientSession  # noqa: E402
+from mcp.client.sse import sse_client  # noqa: E402
+
+from mock_slack import serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+CALLS_PER_SESSION = 50
+SESSION_COUNTS = (1, 4, 16)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(api_url: str) -> str:
+    port = _free_port()
+    os.environ["SLACK_API_URL"] = api_url
+    app = slack_server.create_app(host="127.0.0.1", port=port)
+    threading.Thread(target=lambda: asyncio.run(app.run_sse_async()), daemon=True).start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return f"http://127.0.0.1:{port}/sse"
+        except OSError:
+            time.sleep(0.05)
+
+
+async def session(url: str) -> List[float]:
+    samples = []
+    async with sse_client(url) as streams:
+        async with ClientSession(*streams) as client:
+            await client.initialize()
+            for i in range(CALLS_PER_SESSION):
+                start = time.perf_counter()
+                await client.call_tool(
+                    "slack_get_thread_replies", {"channel_id": "C00000000", "thread_ts": f"1700000000.{i:06d}"}
+                )
+                samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run(url: str, sessions: int) -> Tuple[float, List[float]]:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(session(url) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(sample for samples in results for sample in samples)
+
+
+async def main() -> None:
+    api_url, _ = serve_in_thread()
+    url = start_server(api_url)
+    print(f"{'sessions':>8} {'calls/s':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for sessions in SESSION_COUNTS:
+        elapsed, samples = await run(url, sessions)
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"{sessions:>8} {len(samples) / elapsed:>10.1f} "
+              f"{statistics.median(samples) * 1000:>8.2f} {p95 * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
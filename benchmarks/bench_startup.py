@@ -0,0 +1,65 @@
+"""Cold-start cost of the server, checked against an import-time budget.
+
+Each measurement runs in a fresh interpreter:
+
+* ``import pageless.slack_server`` under ``python -X importtime``, which
+  must stay within the budget (heavy dependencies are imported lazily);
+* ``create_app()``, which pulls in httpx and the FastMCP stack.
+
+Run with ``python benchmarks/bench_startup.py [budget_ms]``; exits non-zero
+when the module import exceeds the budget.
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+IMPORT_BUDGET_MS = 150.0
+RUNS = 5
+
+ENV = {**os.environ, "SLACK_BOT_TOKEN": "xoxb-benchmark", "SLACK_TEAM_ID": "T00000000"}
+
+
+def import_time_ms() -> float:
+    """Cumulative import time of pageless.slack_server reported by -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pageless.slack_server"],
+        env=ENV, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| pageless\.slack_server$", line)
+        if match:
+            return int(match.group(1)) / 1000
+    raise RuntimeError("pageless.slack_server missing from -X importtime output")
+
+
+def wall_ms(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=ENV, check=True, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def _median(samples: List[float]) -> float:
+    return statistics.median(samples)
+
+
+def main() -> int:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else IMPORT_BUDGET_MS
+    imports = _median([import_time_ms() for _ in range(RUNS)])
+    bare = _median([wall_ms("pass") for _ in range(RUNS)])
+    module = _median([wall_ms("import pageless.slack_server") for _ in range(RUNS)])
+    app = _median([wall_ms("from pageless.slack_server import create_app; create_app()") for _ in range(RUNS)])
+
+    print(f"{'interpreter startup':<32} {bare:8.1f} ms")
+    print(f"{'import pageless.slack_server':<32} {module:8.1f} ms  (importtime {imports:.1f} ms)")
+    print(f"{'create_app()':<32} {app:8.1f} ms")
+    within = imports <= budget
+    print(f"import budget {budget:.0f} ms: {'ok' if within else 'EXCEEDED'}")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Buffered vs incremental decoding of large Slack pages.
+
+Run with ``python benchmarks/bench_streaming.py``. Reads a 2000-message
+history window and a 2000-user directory from the mock Slack API with
+full-size records, projected to a few fields the way an agent asks for
+them, once with SLACK_STREAM_DECODE off and once on. Reports wall time,
+time to the first record and peak Python heap (tracemalloc) per run; the
+heap includes the mock server, which runs in a thread of this process.
+"""
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+os.environ.setdefault("SLACK_CACHE", "false")
+
+from mock_slack import Dataset, serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+from pageless.projection import record_projector  # noqa: E402
+
+ROUNDS = 5
+MESSAGE_FIELDS = ["ts", "user", "text"]
+USER_FIELDS = ["id", "name", "profile.real_name"]
+
+
+async def history(client: slack_server.SlackClient) -> float:
+    """Seconds until the first projected message reaches the caller"""
+    start = time.perf_counter()
+    first = []
+    project = record_projector(MESSAGE_FIELDS)
+
+    def transform(message):
+        if not first:
+            first.append(time.perf_counter() - start)
+        return project(message)
+
+    await client.get_channel_history_range("C00000000", oldest="0", max_messages=2000, transform=transform)
+    return first[0]
+
+
+async def users(client: slack_server.SlackClient) -> float:
+    start = time.perf_counter()
+    first = None
+    project = record_projector(USER_FIELDS)
+    members = []
+    async for user in client.iter_users():
+        if first is None:
+            first = time.perf_counter() - start
+        members.append(project(user))
+    return first
+
+
+async def run(stream: bool) -> None:
+    app_settings = slack_server.Settings.from_env()
+    app_settings.stream_decode = stream
+    client = slack_server.create_slack_client(app_settings)
+    await client.start()
+    try:
+        for name, read in (("history x2000", history), ("users x2000", users)):
+            elapsed = first = peak = 0.0
+            for _ in range(ROUNDS):
+                tracemalloc.start()
+                start = time.perf_counter()
+                first += await read(client)
+                elapsed += time.perf_counter() - start
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            print(f"stream={str(stream):<5}  {name:<14} {elapsed / ROUNDS * 1000:8.1f} ms   "
+                  f"first record {first / ROUNDS * 1000:7.1f} ms   peak heap {peak / 2 ** 20:6.1f} MiB")
+    finally:
+        await client.aclose()
+
+
+async def main() -> None:
+    base_url, server = serve_in_thread(dataset=Dataset(channels=10, users=2000, messages=2000, replies=0, realistic=True))
+    os.environ["SLACK_API_URL"] = base_url
+    try:
+        await run(False)
+        await run(True)
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+"""End-to-end latency, throughput and memory for every MCP tool.
+
+Starts the mock Slack API, builds the server with ``create_app`` and drives
+every registered tool through an in-process MCP client session, so each
+call pays for argument validation, the tool body, the Slack round trip and
+result serialization. Reports p50/p95/p99 latency, calls/s, error count and
+process RSS after each tool.
+
+Run with ``python benchmarks/bench_tools.py``; ``--help`` lists the knobs
+(mock latency, dataset size, realistic payloads, 429 injection, calls and
+concurrency). RSS includes the mock server, which runs in a thread of the
+same process. ``--in-process`` injects the mock as an httpx transport
+instead, taking sockets and HTTP parsing out of the measurement.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+from mock_slack import Dataset, Faults, mock_transport, serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+CHANNEL = "C00000000"
+
+# Arguments for call number i of each tool; every registered tool must be listed
+TOOL_ARGUMENTS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "slack_list_channels": lambda i: {"limit": 100},
+    "slack_post_message": lambda i: {"channel_id": CHANNEL, "text": f"benchmark post {i}"},
+    "slack_reply_to_thread": lambda i: {"channel_id": CHANNEL, "thread_ts": "1700000000.000000", "text": f"reply {i}"},
+    "slack_add_reaction": lambda i: {"channel_id": CHANNEL, "timestamp": f"1700000000.{i:06d}", "reaction": "eyes"},
+    "slack_add_reactions_batch": lambda i: {"reactions": [
+        {"channel_id": CHANNEL, "timestamp": f"1700000001.{i:06d}", "reaction": name} for name in ("eyes", "ack", "ok")
+    ]},
+    "slack_get_channel_history": lambda i: {"channel_id": CHANNEL, "limit": 10},
+    "slack_get_channel_history_range": lambda i: {"channel_id": CHANNEL, "oldest": "1700000000", "max_messages": 1000},
+    "slack_get_thread_replies": lambda i: {"channel_id": CHANNEL, "thread_ts": f"1700000000.{i:06d}"},
+    "slack_get_threads_batch": lambda i: {
+        "channel_id": CHANNEL, "thread_ts_list": [f"1700000000.{i * 4 + k:06d}" for k in range(4)]
+    },
+    "slack_get_users": lambda i: {"limit": 100},
+    "slack_get_user_profile": lambda i: {"user_id": f"U{i % 100:08d}"},
+    "slack_list_all_channels": lambda i: {"fields": ["id", "name"]},
+    "slack_list_all_users": lambda i: {"fields": ["id", "name"]},
+    "slack_rate_limit_status": lambda i: {},
+    "slack_cache_status": lambda i: {},
+    "slack_coalesce_status": lambda i: {},
+    "slack_retry_status": lambda i: {},
+    "slack_outbox_status": lambda i: {},
+    "slack_server_stats": lambda i: {},
+}
+
+
+def rss_mb() -> float:
+    """Current resident set size, from /proc where available, else the peak"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(samples: List[float], q: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+async def bench_tool(client: Any, name: str, calls: int, concurrency: int) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[float] = []
+    errors: List[str] = []
+
+    async def call(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            result = await client.call_tool(name, TOOL_ARGUMENTS[name](i))
+            samples.append(time.perf_counter() - start)
+        text = result.content[0].text
+        if result.isError:
+            errors.append(text)
+        elif "error" in json.loads(text):
+            errors.append(json.loads(text)["error"])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(calls)))
+    elapsed = time.perf_counter() - start
+    samples.sort()
+    return {
+        "p50": percentile(samples, 0.50) * 1000,
+        "p95": percentile(samples, 0.95) * 1000,
+        "p99": percentile(samples, 0.99) * 1000,
+        "throughput": calls / elapsed,
+        "errors": errors,
+        "rss": rss_mb(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=200, help="Calls per tool (default 200)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent calls per tool (default 8)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock latency per response in seconds")
+    parser.add_argument("--channels", type=int, default=300, help="Channels in the mock workspace")
+    parser.add_argument("--users", type=int, default=500, help="Users in the mock workspace")
+    parser.add_argument("--messages", type=int, default=500, help="Messages in each channel's history")
+    parser.add_argument("--replies", type=int, default=20, help="Replies in each thread")
+    parser.add_argument("--realistic", action="store_true", help="Full-size Slack records instead of minimal ones")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--client-rate-limit", action="store_true", help="Keep client-side rate limiting on")
+    parser.add_argument("--in-process", action="store_true", help="Serve the mock as an httpx transport, no sockets")
+    parser.add_argument("--tools", nargs="*", help="Only run these tools")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    if not args.client_rate_limit:
+        # Measure the server, not Slack's published limits
+        os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+    os.environ.setdefault("SLACK_RETRY_BASE_DELAY", "0.01")
+
+    dataset = Dataset(args.channels, args.users, args.messages, args.replies, args.realistic)
+    faults = Faults(error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, retry_after=0)
+    if args.in_process:
+        server = None
+        app = slack_server.create_app(http_transport=mock_transport(args.latency, faults, dataset))
+    else:
+        base_url, server = serve_in_thread(args.latency, faults, dataset)
+        os.environ["SLACK_API_URL"] = base_url
+        app = slack_server.create_app()
+
+    try:
+        async with create_connected_server_and_client_session(app._mcp_server) as client:
+            registered = [tool.name for tool in (await client.list_tools()).tools]
+            missing = sorted(set(registered) - set(TOOL_ARGUMENTS))
+            if missing:
+                raise SystemExit(f"No benchmark arguments for: {', '.join(missing)}")
+
+            print(f"{'tool':<34} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'calls/s':>9} {'errors':>6} {'RSS MB':>7}")
+            first_errors = {}
+            for name in registered:
+                if args.tools and name not in args.tools:
+                    continue
+                if name == "slack_rate_limit_status" and not args.client_rate_limit:
+                    # Reports an error by design while rate limiting is off
+                    continue
+                stats = await bench_tool(client, name, args.calls, args.concurrency)
+                print(f"{name:<34} {stats['p50']:>8.2f} {stats['p95']:>8.2f} {stats['p99']:>8.2f} "
+                      f"{stats['throughput']:>9.1f} {len(stats['errors']):>6} {stats['rss']:>7.1f}")
+                if stats["errors"]:
+                    first_errors[name] = stats["errors"][0]
+            for name, error in first_errors.items():
+                print(f"{name}: {' '.join(error.split())[:160]}")
+    finally:
+        await slack_server.shutdown()
+        if server is not None:
+            server.should_exit = True
+    print(f"Slack requests served: {sum(faults.requests.values())}, 429s injected: "
+          f"{sum(faults.rate_limited.values())}, 503s injected: {sum(faults.errors.values())}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
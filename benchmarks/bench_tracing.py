@@ -0,0 +1,57 @@
+"""Per-tool-call cost of tracing: disabled, and exporting to a file.
+
+Run with ``python benchmarks/bench_tracing.py``. Tools are called in-process
+against the zero-latency mock, so the numbers are dominated by local work and
+the tracing overhead is easy to see.
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("SLACK_TEAM_ID", "T00000000")
+os.environ.setdefault("SLACK_RATE_LIMIT", "false")
+
+from mock_slack import serve_in_thread  # noqa: E402
+from pageless import slack_server  # noqa: E402
+
+CALLS = 500
+
+
+async def run(label: str, trace_file: str = None) -> None:
+    app_settings = slack_server.Settings.from_env()
+    app_settings.trace_file = trace_file
+    slack_server.create_app(app_settings)
+    await slack_server.slack_client.start()
+    samples = []
+    try:
+        for _ in range(CALLS):
+            start = time.perf_counter()
+            await slack_server.slack_get_channel_history("C00000000")
+            samples.append(time.perf_counter() - start)
+    finally:
+        await slack_server.shutdown()
+        slack_server.tracer.close()
+    print(f"{label:<16} mean {statistics.mean(samples) * 1e6:8.1f} us   p50 {statistics.median(samples) * 1e6:8.1f} us")
+
+
+async def main() -> None:
+    base_url, server = serve_in_thread()
+    os.environ["SLACK_API_URL"] = base_url
+    try:
+        await run("tracing off")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spans.jsonl")
+            await run("tracing to file", path)
+            with open(path) as spans:
+                print(f"{sum(1 for _ in spans)} spans written")
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Slack-shaped payloads at realistic sizes for the benchmarks.
+
+Records mirror the fields Slack actually returns (profile image URLs,
+locale, rich text blocks, reactions...) so payload sizes and encode times
+are representative of a real workspace.
+"""
+from typing import Any, Dict, List
+
+
+def member(i: int) -> Dict[str, Any]:
+    avatar = f"https://avatars.slack-edge.com/2024-01-01/{i:012d}_0a1b2c3d4e5f6a7b8c9d"
+    return {
+        "id": f"U{i:08d}",
+        "team_id": "T00000000",
+        "name": f"user{i}",
+        "deleted": False,
+        "color": "9f69e7",
+        "real_name": f"User Number {i}",
+        "tz": "America/Los_Angeles",
+        "tz_label": "Pacific Daylight Time",
+        "tz_offset": -25200,
+        "profile": {
+            "title": "Site Reliability Engineer",
+            "phone": "",
+            "skype": "",
+            "real_name": f"User Number {i}",
+            "real_name_normalized": f"User Number {i}",
+            "display_name": f"user{i}",
+            "display_name_normalized": f"user{i}",
+            "fields": None,
+            "status_text": "On call" if i % 7 == 0 else "",
+            "status_emoji": ":pager:" if i % 7 == 0 else "",
+            "status_emoji_display_info": [],
+            "status_expiration": 0,
+            "avatar_hash": f"{i:012x}",
+            "image_original": f"{avatar}_original.png",
+            "is_custom_image": True,
+            "email": f"user{i}@example.com",
+            "first_name": "User",
+            "last_name": f"Number {i}",
+            **{f"image_{size}": f"{avatar}_{size}.png" for size in (24, 32, 48, 72, 192, 512, 1024)},
+            "status_text_canonical": "",
+            "team": "T00000000",
+        },
+        "is_admin": False,
+        "is_owner": False,
+        "is_primary_owner": False,
+        "is_restricted": False,
+        "is_ultra_restricted": False,
+        "is_bot": False,
+        "is_app_user": False,
+        "updated": 1700000000 + i,
+        "is_email_confirmed": True,
+        "who_can_share_contact_card": "EVERYONE",
+        "locale": "en-US",
+    }
+
+
+def message(i: int) -> Dict[str, Any]:
+    text = f"[ALERT {i}] p99 latency above SLO on checkout-api in us-east-1, see runbook"
+    msg: Dict[str, Any] = {
+        "type": "message",
+        "user": f"U{i % 50:08d}",
+        "text": text,
+        "ts": f"{1700000000 + i}.{i:06d}",
+        "client_msg_id": f"{i:08x}-0000-4000-8000-{i:012x}",
+        "team": "T00000000",
+        "blocks": [{
+            "type": "rich_text",
+            "block_id": f"b{i:05d}",
+            "elements": [{
+                "type": "rich_text_section",
+                "elements": [{"type": "text", "text": text}],
+            }],
+        }],
+    }
+    if i % 4 == 0:
+        msg["thread_ts"] = msg["ts"]
+        msg["reply_count"] = i % 9
+        msg["reply_users"] = [f"U{(i + k) % 50:08d}" for k in range(3)]
+        msg["latest_reply"] = f"{1700000100 + i}.{i:06d}"
+    if i % 3 == 0:
+        msg["reactions"] = [{"name": "eyes", "users": [f"U{i % 50:08d}"], "count": 1}]
+    return msg
+
+
+def users_list_page(count: int = 200) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "members": [member(i) for i in range(count)],
+        "cache_ts": 1700000000,
+        "response_metadata": {"next_cursor": "dXNlcjpVMEc5V0ZYTlo="},
+    }
+
+
+def history_page(count: int = 200) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "messages": [message(i) for i in range(count)],
+        "has_more": True,
+        "pin_count": 0,
+        "channel_actions_ts": None,
+        "channel_actions_count": 0,
+        "response_metadata": {"next_cursor": "bmV4dF90czoxNzAwMDAwMDAw"},
+    }
+
+
+def all_pages() -> List[Any]:
+    return [
+        ("users.list x200", users_list_page(), "members", ["id", "name", "real_name", "profile.title"]),
+        ("conversations.history x200", history_page(), "messages", ["ts", "user", "text", "thread_ts", "reply_count"]),
+    ]
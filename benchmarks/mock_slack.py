@@ -0,0 +1,218 @@
+"""Local mock of the Slack Web API used by the benchmarks.
+
+Serves ``ok: true`` payloads for the methods ``SlackClient`` calls so the
+server can be exercised end-to-end without touching slack.com. ``Dataset``
+sets the size of the workspace and of each record, with cursor pagination
+and time windows applied like Slack does. ``Faults`` injects 5xx responses
+and 429s at random to exercise the retry paths. ``mock_transport`` serves
+the same responses in-process as an httpx transport, with no network at all.
+"""
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+import fixtures
+
+
+@dataclass
+class Dataset:
+    """Shape of the mock workspace
+
+    Lists are served ``limit`` records at a time with Slack-style cursors.
+    ``realistic`` uses the full-size records from fixtures.py instead of
+    minimal ones, so payload sizes match a real workspace.
+    """
+
+    channels: int = 100
+    users: int = 100
+    # Messages in every channel's history, and replies in every thread
+    messages: int = 10
+    replies: int = 10
+    realistic: bool = False
+
+    def __post_init__(self):
+        make_member = fixtures.member if self.realistic else _member
+        make_message = fixtures.message if self.realistic else _message
+        self.channel_records = [{"id": f"C{i:08d}", "name": f"channel-{i}"} for i in range(self.channels)]
+        self.user_records = [make_member(i) for i in range(self.users)]
+        # Newest first, like conversations.history
+        self.message_records = [make_message(i) for i in reversed(range(self.messages))]
+        self.reply_records = [
+            {**make_message(i), "ts": f"1800000000.{i:06d}"} for i in range(self.replies)
+        ]
+
+
+# (status, JSON payload or plain text body, headers)
+Reply = Tuple[int, Any, Dict[str, str]]
+
+
+def _member(i: int) -> Dict[str, Any]:
+    return {"id": f"U{i:08d}", "name": f"user{i}", "profile": {"display_name": f"user{i}"}}
+
+
+def _message(i: int) -> Dict[str, Any]:
+    return {
+        "type": "message",
+        "user": f"U{i % 50:08d}",
+        "text": f"message {i} " + "lorem ipsum " * 8,
+        "ts": f"{1700000000 + i}.{i:06d}",
+    }
+
+
+def _page(records: List[Dict[str, Any]], params: Dict[str, str], default_limit: int = 100) -> Tuple[List[Any], str]:
+    offset = int(params.get("cursor", "offset:0").split(":")[1])
+    limit = int(params.get("limit", default_limit))
+    end = offset + limit
+    return records[offset:end], f"offset:{end}" if end < len(records) else ""
+
+
+def _in_window(ts: str, params: Dict[str, str]) -> bool:
+    inclusive = params.get("inclusive") == "true"
+    oldest, latest = params.get("oldest"), params.get("latest")
+    if oldest and (float(ts) < float(oldest) or (not inclusive and float(ts) == float(oldest))):
+        return False
+    if latest and (float(ts) > float(latest) or (not inclusive and float(ts) == float(latest))):
+        return False
+    return True
+
+
+def _payload(method: str, params: Dict[str, str], dataset: Dataset) -> Dict[str, Any]:
+    if method == "conversations.list":
+        channels, cursor = _page(dataset.channel_records, params)
+        return {"ok": True, "channels": channels, "response_metadata": {"next_cursor": cursor}}
+    if method == "conversations.history":
+        window = [m for m in dataset.message_records if _in_window(m["ts"], params)]
+        messages, cursor = _page(window, params)
+        return {"ok": True, "messages": messages, "has_more": bool(cursor),
+                "response_metadata": {"next_cursor": cursor}}
+    if method == "conversations.replies":
+        parent = {**_message(0), "ts": params.get("ts", "1700000000.000000"), "reply_count": dataset.replies}
+        replies, cursor = _page(dataset.reply_records, params, default_limit=1000)
+        # Slack repeats the parent at the top of every page
+        return {"ok": True, "messages": [parent] + replies, "has_more": bool(cursor),
+                "response_metadata": {"next_cursor": cursor}}
+    if method == "users.list":
+        members, cursor = _page(dataset.user_records, params)
+        return {"ok": True, "members": members, "response_metadata": {"next_cursor": cursor}}
+    if method == "users.profile.get":
+        return {"ok": True, "profile": {"real_name": "Mock User", "display_name": "mock"}}
+    if method == "chat.postMessage":
+        return {"ok": True, "ts": f"{time.time():.6f}"}
+    if method == "reactions.add":
+        return {"ok": True}
+    return {"ok": False, "error": "unknown_method"}
+
+
+@dataclass
+class Faults:
+    """Fraction of requests answered with a 503 (non-JSON) or a 429, plus counters"""
+
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    # Requests received, 503s and 429s sent, per method
+    requests: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    rate_limited: Counter = field(default_factory=Counter)
+
+    def inject(self, method: str) -> Optional[Reply]:
+        self.requests[method] += 1
+        roll = random.random()
+        if roll < self.error_rate:
+            self.errors[method] += 1
+            # Like a lost reply: the client cannot tell whether Slack acted on it
+            return 503, "upstream unavailable", {}
+        if roll < self.error_rate + self.rate_limit_rate:
+            self.rate_limited[method] += 1
+            return 429, {"ok": False, "error": "ratelimited"}, {"Retry-After": str(self.retry_after)}
+        return None
+
+
+class MockSlack:
+    """The mock's request handling, shared by the HTTP app and the in-process transport"""
+
+    def __init__(self, latency: float = 0.0, faults: Optional[Faults] = None, dataset: Optional[Dataset] = None):
+        self.latency = latency
+        self.faults = faults
+        self.dataset = dataset or Dataset()
+        self.reactions = set()
+
+    async def respond(self, method: str, params: Dict[str, str], body: bytes) -> Reply:
+        """Return (status, JSON payload or plain text, headers) for one API call"""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.faults is not None:
+            fault = self.faults.inject(method)
+            if fault is not None:
+                return fault
+        if method == "reactions.add":
+            request = json.loads(body)
+            reaction = (request["channel"], request["timestamp"], request["name"])
+            if reaction in self.reactions:
+                return 200, {"ok": False, "error": "already_reacted"}, {}
+            self.reactions.add(reaction)
+        return 200, _payload(method, params, self.dataset), {}
+
+
+def create_app(latency: float = 0.0, faults: Optional[Faults] = None, dataset: Optional[Dataset] = None) -> Starlette:
+    """Build the mock app; ``latency`` seconds are added to every response"""
+    mock = MockSlack(latency, faults, dataset)
+
+    async def api(request: Request) -> Response:
+        status, payload, headers = await mock.respond(
+            request.path_params["method"], dict(request.query_params), await request.body()
+        )
+        if isinstance(payload, str):
+            return PlainTextResponse(payload, status_code=status, headers=headers)
+        return JSONResponse(payload, status_code=status, headers=headers)
+
+    return Starlette(routes=[Route("/api/{method}", api, methods=["GET", "POST"])])
+
+
+def mock_transport(
+    latency: float = 0.0,
+    faults: Optional[Faults] = None,
+    dataset: Optional[Dataset] = None
+) -> httpx.MockTransport:
+    """The mock as an httpx transport: no sockets, for any base URL ending in /api"""
+    mock = MockSlack(latency, faults, dataset)
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        status, payload, headers = await mock.respond(method, dict(request.url.params), await request.aread())
+        if isinstance(payload, str):
+            return httpx.Response(status, text=payload, headers=headers)
+        return httpx.Response(status, json=payload, headers=headers)
+
+    return httpx.MockTransport(handle)
+
+
+def serve_in_thread(
+    latency: float = 0.0,
+    faults: Optional[Faults] = None,
+    dataset: Optional[Dataset] = None
+) -> Tuple[str, uvicorn.Server]:
+    """Start the mock on a free localhost port; returns (api base URL, server)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    app = create_app(latency, faults, dataset)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/api", server
@@ -0,0 +1,150 @@
+"""Record and replay Slack Web API traffic.
+
+``RecordingTransport`` wraps the real httpx transport and appends every
+request/response pair to a cassette: one JSON object per line, gzip
+compressed when the path ends in ``.gz``. Tokens never reach the file: the
+Authorization header is not recorded and anything shaped like a Slack token
+is redacted. ``ReplayTransport`` serves a cassette back with the recorded
+latency, scaled by ``speed``, so production-shaped sessions can be rerun
+offline.
+"""
+import asyncio
+import gzip
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from typing import IO, Any, Deque, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+TOKEN_PATTERN = re.compile(r"xox[a-z]-[A-Za-z0-9-]+")
+
+# Response headers worth keeping; the rest only bloats the cassette
+RECORDED_HEADERS = ("content-type", "retry-after")
+
+
+def scrub(text: str) -> str:
+    """Replace anything shaped like a Slack token"""
+    return TOKEN_PATTERN.sub("xoxx-REDACTED", text)
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _records(cassette: IO[str]) -> Iterator[str]:
+    """Lines of a cassette, stopping where a recording broke off
+
+    A recorder killed before closing its file leaves a gzip stream without
+    the end-of-stream marker, and maybe a last line cut short. Each record
+    is flushed as it is written, so everything before that is still served.
+    """
+    try:
+        for line in cassette:
+            if not line.endswith("\n"):
+                return
+            yield line
+    except EOFError:
+        return
+
+
+def _request_key(verb: str, api_method: str, params: Dict[str, str], body: str) -> Tuple[str, str, str]:
+    return verb, api_method, json.dumps({"params": params, "body": body}, sort_keys=True)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests through to ``inner`` and appends each exchange to a cassette"""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, path: str):
+        self.inner = inner
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        entry = {
+            "verb": request.method,
+            "api": request.url.path.rsplit("/", 1)[-1],
+            "params": {name: scrub(value) for name, value in request.url.params.items()},
+            "body": scrub(request.content.decode("utf-8", "replace")),
+            "elapsed": round(time.perf_counter() - start, 6),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "response": scrub(content.decode("utf-8", "replace")),
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            # Opened lazily so the client can be closed and started again
+            if self._file is None:
+                self._file = _open(self.path, "a")
+            self._file.write(line)
+            self._file.flush()
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=content, request=request,
+            extensions=response.extensions
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests from a cassette instead of the network
+
+    Requests match on HTTP verb, API method, query parameters and body; a
+    request with no exact match takes the next recorded response for the
+    same API method (a post with different text, say). Repeated requests
+    walk through the recorded responses in order and then stay on the last.
+    ``speed`` scales the recorded latency: 1.0 is real time, 2.0 twice as
+    fast and 0 no delay. Unknown methods get ``ok: false, error:
+    cassette_miss``.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self.misses = 0
+        self._exact: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._by_method: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        with _open(path, "r") as cassette:
+            for line in _records(cassette):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._exact[_request_key(entry["verb"], entry["api"], entry["params"], entry["body"])].append(entry)
+                self._by_method[(entry["verb"], entry["api"])].append(entry)
+
+    @staticmethod
+    def _take(entries: Deque[Dict[str, Any]]) -> Dict[str, Any]:
+        if len(entries) > 1:
+            return entries.popleft()
+        return entries[0]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        api_method = request.url.path.rsplit("/", 1)[-1]
+        body = (await request.aread()).decode("utf-8", "replace")
+        params = dict(request.url.params.items())
+        entries = self._exact.get(_request_key(request.method, api_method, params, body))
+        if not entries:
+            entries = self._by_method.get((request.method, api_method))
+        if not entries:
+            self.misses += 1
+            return httpx.Response(200, json={"ok": False, "error": "cassette_miss"}, request=request)
+
+        entry = self._take(entries)
+        if self.speed:
+            await asyncio.sleep(entry["elapsed"] / self.speed)
+        return httpx.Response(
+            entry["status"], headers=entry["headers"], content=entry["response"].encode(), request=request
+        )
@@ -0,0 +1,195 @@
+"""Shared rate limit budget and cache for multi-process serving.
+
+In worker mode several server processes talk to Slack with the same token.
+The parent process runs a ``Coordinator`` on a Unix socket that owns the one
+``RateLimiter`` and ``TTLCache``; each worker swaps in ``SharedRateLimiter``
+and ``SharedCache``, which forward to it. The protocol is newline-delimited
+JSON, with requests multiplexed over one connection per worker by id.
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from pageless.cache import SingleFlight, TTLCache
+from pageless.ratelimit import RateLimiter
+
+# Slack pages can exceed asyncio's default 64 KiB line limit
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+class Coordinator:
+    """Serves the shared rate limiter and cache to worker processes"""
+
+    def __init__(self, path: str, rate_limiter: Optional[RateLimiter], cache: Optional[TTLCache]):
+        self.path = path
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._handle, self.path, limit=STREAM_LIMIT)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Closing the streams ends the handlers at EOF; cancelling them
+        # instead logs spurious tracebacks on Python 3.11
+        for writer in list(self._connections):
+            writer.close()
+            await writer.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(request: Dict[str, Any]) -> None:
+            try:
+                reply = {"id": request["id"], "result": await self._dispatch(request)}
+            except Exception as e:
+                reply = {"id": request["id"], "error": str(e)}
+            async with lock:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                # Requests run concurrently: an acquire may wait for seconds
+                task = asyncio.create_task(answer(json.loads(line)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            self._connections.discard(writer)
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Any:
+        op = request["op"]
+        if op == "acquire":
+            return await self.rate_limiter.acquire(request["method"], request["channel"])
+        if op == "retry_after":
+            self.rate_limiter.retry_after(request["method"], request["channel"], request["seconds"])
+            return None
+        if op == "rate_limit_stats":
+            return self.rate_limiter.stats()
+        if op == "cache_get":
+            value = self.cache.get(request["key"])
+            if value is None:
+                self.cache.misses += 1
+            else:
+                self.cache.hits += 1
+            return value
+        if op == "cache_set":
+            self.cache.set(request["key"], request["value"], request["ttl"])
+            return None
+        if op == "cache_stats":
+            return self.cache.stats()
+        raise ValueError(f"Unknown coordinator op: {op}")
+
+
+class CoordinatorClient:
+    """One multiplexed connection from a worker to the coordinator"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, "asyncio.Future[Any]"] = {}
+        self._next_id = 0
+        self._connect_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> None:
+        async with self._connect_lock:
+            if self._writer is None:
+                reader, self._writer = await asyncio.open_unix_connection(self.path, limit=STREAM_LIMIT)
+                self._reader_task = asyncio.create_task(self._read(reader))
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                reply = json.loads(line)
+                future = self._pending.pop(reply["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in reply:
+                    future.set_exception(RuntimeError(reply["error"]))
+                else:
+                    future.set_result(reply["result"])
+        finally:
+            self._writer = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Lost connection to the coordinator"))
+            self._pending.clear()
+
+    def send(self, op: str, **args: Any) -> None:
+        """Fire-and-forget request, written in order with any later calls"""
+        if self._writer is not None:
+            self._writer.write(json.dumps({"id": 0, "op": op, **args}).encode() + b"\n")
+
+    async def call(self, op: str, **args: Any) -> Any:
+        await self._connect()
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": op, **args}).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+
+class SharedRateLimiter:
+    """RateLimiter stand-in whose buckets live in the coordinator"""
+
+    def __init__(self, client: CoordinatorClient):
+        self.client = client
+
+    async def acquire(self, method: str, channel: Optional[str] = None) -> float:
+        return await self.client.call("acquire", method=method, channel=channel)
+
+    def retry_after(self, method: str, channel: Optional[str], seconds: float) -> None:
+        self.client.send("retry_after", method=method, channel=channel, seconds=seconds)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self.client.call("rate_limit_stats")
+
+
+class SharedCache:
+    """TTLCache stand-in backed by the coordinator's cache
+
+    Values travel as JSON text: ``encode`` turns a value into text and
+    ``decode`` turns it back. Concurrent misses within one worker are
+    collapsed; across workers a key may be loaded more than once.
+    """
+
+    def __init__(self, client: CoordinatorClient, encode: Callable[[Any], str], decode: Callable[[str], Any]):
+        self.client = client
+        self.encode = encode
+        self.decode = decode
+        self._flight = SingleFlight()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True,
+        ttl: Optional[float] = None
+    ) -> Any:
+        wire_key = json.dumps(key)
+
+        async def load() -> Any:
+            cached = await self.client.call("cache_get", key=wire_key)
+            if cached is not None:
+                return self.decode(cached)
+            value = await loader()
+            if cacheable(value):
+                await self.client.call("cache_set", key=wire_key, value=self.encode(value), ttl=ttl)
+            return value
+
+        return await self._flight.do(wire_key, load)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self.client.call("cache_stats")
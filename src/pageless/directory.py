@@ -0,0 +1,100 @@
+"""Name to ID resolution for channels and users.
+
+Tools accept ``#channel-name`` and ``@handle`` wherever they take an ID.
+``NameIndex`` builds the lookup tables lazily from the bulk channel and user
+iterators, serves them from memory, and refreshes them in the background
+once they are older than the refresh interval.
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+RecordIterator = Callable[[], AsyncIterator[Dict[str, Any]]]
+
+
+class _Index:
+    """One name -> ID table plus its refresh bookkeeping"""
+
+    def __init__(self, kind: str, load: Callable[[], Any], refresh_interval: float):
+        self.kind = kind
+        self.load = load
+        self.refresh_interval = refresh_interval
+        self.ids: Dict[str, str] = {}
+        self.loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _reload(self) -> None:
+        self.ids = await self.load()
+        self.loaded_at = time.monotonic()
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._reload()
+
+    def _refresh_in_background(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.refresh())
+            # A failed refresh keeps the old table; the next lookup retries
+            self._task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def resolve(self, name: str) -> str:
+        key = name.lower()
+        if self.loaded_at is None:
+            # Concurrent first lookups wait for a single load
+            async with self._lock:
+                if self.loaded_at is None:
+                    await self._reload()
+        elif time.monotonic() - self.loaded_at > self.refresh_interval:
+            self._refresh_in_background()
+
+        if key not in self.ids and time.monotonic() - self.loaded_at > 60:
+            # Possibly created since the last load; reload at most once a minute
+            await self.refresh()
+        if key not in self.ids:
+            raise ValueError(f"Unknown {self.kind}: {name}")
+        return self.ids[key]
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+class NameIndex:
+    """Resolves ``#channel`` and ``@user`` references to Slack IDs"""
+
+    def __init__(self, iter_channels: RecordIterator, iter_users: RecordIterator, refresh_interval: float = 600.0):
+        self._iter_channels = iter_channels
+        self._iter_users = iter_users
+        self.channels = _Index("channel", self._load_channels, refresh_interval)
+        self.users = _Index("user", self._load_users, refresh_interval)
+
+    async def _load_channels(self) -> Dict[str, str]:
+        return {channel["name"].lower(): channel["id"] async for channel in self._iter_channels() if "name" in channel}
+
+    async def _load_users(self) -> Dict[str, str]:
+        ids: Dict[str, str] = {}
+        async for user in self._iter_users():
+            if user.get("deleted"):
+                continue
+            # Display names are what people type after @; handles are the fallback
+            for handle in (user.get("name"), user.get("profile", {}).get("display_name")):
+                if handle:
+                    ids.setdefault(handle.lower(), user["id"])
+        return ids
+
+    async def resolve_channel(self, channel: str) -> str:
+        """Return the channel ID for ``#name``; anything else is assumed to be an ID"""
+        if not channel.startswith("#"):
+            return channel
+        return await self.channels.resolve(channel[1:])
+
+    async def resolve_user(self, user: str) -> str:
+        """Return the user ID for ``@handle``; anything else is assumed to be an ID"""
+        if not user.startswith("@"):
+            return user
+        return await self.users.resolve(user[1:])
+
+    def close(self) -> None:
+        self.channels.cancel()
+        self.users.cancel()
@@ -0,0 +1,77 @@
+"""Message filters applied while paging through channel history.
+
+Busy channels are mostly noise for an agent: bot alerts, joins and leaves,
+messages that only collected reactions. ``MessageFilter`` lets
+``SlackClient`` drop those as pages are decoded, so only matching messages
+are kept, serialized and returned.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern
+
+# Stands for ordinary messages, which carry no subtype, in subtype lists
+PLAIN_SUBTYPE = "message"
+
+
+@dataclass
+class MessageFilter:
+    """Criteria a message must all meet; None or empty means any"""
+
+    user_ids: List[str] = field(default_factory=list)
+    # True keeps only bot messages, False drops them
+    bots: Optional[bool] = None
+    subtypes: List[str] = field(default_factory=list)
+    exclude_subtypes: List[str] = field(default_factory=list)
+    # True keeps only thread parents with replies, False drops them
+    has_thread: Optional[bool] = None
+    has_reactions: Optional[bool] = None
+    # Case-insensitive regular expression searched in the message text
+    text_pattern: Optional[Pattern[str]] = None
+
+    @classmethod
+    def from_args(
+        cls,
+        user_ids: Optional[List[str]] = None,
+        bots: Optional[bool] = None,
+        subtypes: Optional[List[str]] = None,
+        exclude_subtypes: Optional[List[str]] = None,
+        has_thread: Optional[bool] = None,
+        has_reactions: Optional[bool] = None,
+        text_pattern: Optional[str] = None
+    ) -> "MessageFilter":
+        """Build a filter from tool arguments; raises ValueError for a bad pattern"""
+        try:
+            pattern = re.compile(text_pattern, re.IGNORECASE) if text_pattern else None
+        except re.error as e:
+            raise ValueError(f"Invalid text_pattern: {e}") from e
+        return cls(
+            list(user_ids or []), bots, list(subtypes or []), list(exclude_subtypes or []),
+            has_thread, has_reactions, pattern
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(
+            self.user_ids or self.bots is not None or self.subtypes or self.exclude_subtypes
+            or self.has_thread is not None or self.has_reactions is not None or self.text_pattern
+        )
+
+    def matches(self, message: Dict[str, Any]) -> bool:
+        if self.user_ids and message.get("user") not in self.user_ids:
+            return False
+        if self.bots is not None:
+            is_bot = bool(message.get("bot_id")) or message.get("subtype") == "bot_message"
+            if is_bot != self.bots:
+                return False
+        subtype = message.get("subtype", PLAIN_SUBTYPE)
+        if self.subtypes and subtype not in self.subtypes:
+            return False
+        if subtype in self.exclude_subtypes:
+            return False
+        if self.has_thread is not None and (message.get("reply_count", 0) > 0) != self.has_thread:
+            return False
+        if self.has_reactions is not None and bool(message.get("reactions")) != self.has_reactions:
+            return False
+        if self.text_pattern is not None and not self.text_pattern.search(message.get("text", "")):
+            return False
+        return True
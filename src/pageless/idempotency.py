@@ -0,0 +1,117 @@
+"""Client-side idempotency keys for message posting.
+
+When a tool call times out the agent tends to call it again, and Slack has
+no idempotency for ``chat.postMessage``. ``IdempotencyStore`` remembers the
+response of every post made with an idempotency key, so a repeated key
+returns the original result instead of posting again. Entries live in a
+bounded in-memory LRU and, optionally, in a SQLite file that survives
+restarts and is shared by worker processes.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from pageless.cache import SingleFlight
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    key TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    result TEXT NOT NULL
+);
+"""
+
+
+class IdempotencyStore:
+    """Bounded map from idempotency key to the response of the original post"""
+
+    def __init__(self, ttl: float = 86400.0, max_entries: int = 10000, path: Optional[str] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.replayed = 0
+        # key -> (created, response), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+
+    async def _run(self, fn, *args) -> Any:
+        def locked() -> Any:
+            with self._lock, self._db:
+                return fn(*args)
+        return await asyncio.to_thread(locked)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.time() - self.ttl:
+            return entry[1]
+        if self._db is None:
+            return None
+
+        def query() -> Optional[Tuple[float, str]]:
+            return self._db.execute(
+                "SELECT created, result FROM posts WHERE key = ? AND created > ?", (key, time.time() - self.ttl)
+            ).fetchone()
+        row = await self._run(query)
+        if row is None:
+            return None
+        response = json.loads(row[1])
+        self._remember(key, row[0], response)
+        return response
+
+    async def set(self, key: str, response: Dict[str, Any]) -> None:
+        created = time.time()
+        self._remember(key, created, response)
+        if self._db is not None:
+            def store() -> None:
+                self._db.execute("DELETE FROM posts WHERE created <= ?", (created - self.ttl,))
+                self._db.execute(
+                    "INSERT OR REPLACE INTO posts (key, created, result) VALUES (?, ?, ?)",
+                    (key, created, json.dumps(response))
+                )
+            await self._run(store)
+
+    def _remember(self, key: str, created: float, response: Dict[str, Any]) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (created, response)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def post_once(self, key: str, post: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run ``post`` unless ``key`` already succeeded; replays are marked ``deduplicated``
+
+        Concurrent calls with the same key wait for the first one. Failed
+        posts are not remembered, so the key can be retried.
+        """
+        async def once() -> Dict[str, Any]:
+            previous = await self.get(key)
+            if previous is not None:
+                self.replayed += 1
+                return {**previous, "deduplicated": True}
+            response = await post()
+            if response.get("ok"):
+                await self.set(key, response)
+            return response
+
+        return await self._flight.do(key, once)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "replayed": self.replayed,
+            "persistent": self._db is not None,
+        }
@@ -0,0 +1,142 @@
+"""Incremental decoding of Slack list responses.
+
+A ``conversations.history`` or ``users.list`` page is one JSON object whose
+bulk is a single array of records (``messages``, ``members``...).
+``RecordStream`` is fed the body chunk by chunk and hands back each record
+as soon as it is complete, so callers can project or filter records while
+the rest of the page is still arriving instead of holding the whole body
+and the whole decoded page at once. Values are decoded with the stdlib C
+scanner; the envelope (``ok``, ``error``, ``response_metadata``...) is
+returned by ``close()``.
+"""
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_START = 0    # before the opening brace
+_KEY = 1      # expecting a key or the closing brace
+_VALUE = 2    # expecting the value of self._name
+_NEXT = 3     # after a value, expecting a comma or the closing brace
+_RECORDS = 4  # inside the record array
+_DONE = 5
+
+
+class RecordStream:
+    """Feeds a JSON object in chunks, yielding the elements of the array under ``key``"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.envelope: Dict[str, Any] = {}
+        self.records = 0
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _START
+        self._name = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add the next chunk of the body; returns the records it completed"""
+        self._buffer += self._utf8.decode(chunk)
+        return self._parse()
+
+    def close(self) -> Dict[str, Any]:
+        """Finish the body; returns everything but the records, or raises ValueError"""
+        self._buffer += self._utf8.decode(b"", final=True)
+        records = self._parse(final=True)
+        if records or self._state != _DONE or self._buffer.strip():
+            raise ValueError(f"Incomplete or invalid JSON object (parser state {self._state})")
+        return self.envelope
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> Tuple[Any, Optional[int]]:
+        """raw_decode one value; None, None while it may still be incomplete"""
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None, None
+        if buffer[pos] not in '{["' and not final:
+            # A number or literal not yet followed by a delimiter may continue
+            # in the next chunk ("-1" of "-1.5e3")
+            after = _WHITESPACE.match(buffer, end).end()
+            if after >= len(buffer) or buffer[after] not in ",}]":
+                return None, None
+        return value, end
+
+    def _parse(self, final: bool = False) -> List[Any]:
+        records: List[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            state = self._state
+            if state == _START:
+                if char != "{":
+                    raise ValueError("Expected a JSON object")
+                pos += 1
+                self._state = _KEY
+            elif state == _KEY:
+                if char == "}":
+                    pos += 1
+                    self._state = _DONE
+                    continue
+                if char != '"':
+                    raise ValueError(f"Expected a key at {char!r}")
+                try:
+                    name, end = json.decoder.scanstring(buffer, pos + 1)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                end = _WHITESPACE.match(buffer, end).end()
+                if end >= len(buffer):
+                    break
+                if buffer[end] != ":":
+                    raise ValueError(f"Expected ':' after key {name!r}")
+                self._name = name
+                pos = end + 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._name == self.key and char == "[":
+                    pos += 1
+                    self._state = _RECORDS
+                    continue
+                value, end = self._decode(buffer, pos, final)
+                if end is None:
+                    break
+                self.envelope[self._name] = value
+                pos = end
+                self._state = _NEXT
+            elif state == _NEXT:
+                if char == ",":
+                    self._state = _KEY
+                elif char == "}":
+                    self._state = _DONE
+                else:
+                    raise ValueError(f"Expected ',' or '}}' at {char!r}")
+                pos += 1
+            elif state == _RECORDS:
+                if char == "]":
+                    pos += 1
+                    self._state = _NEXT
+                elif char == ",":
+                    pos += 1
+                else:
+                    record, end = self._decode(buffer, pos, final)
+                    if end is None:
+                        break
+                    records.append(record)
+                    pos = end
+            else:
+                raise ValueError("Extra data after the JSON object")
+        # Keep only the unparsed tail
+        self._buffer = buffer[pos:]
+        self.records += len(records)
+        return records
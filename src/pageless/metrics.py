@@ -0,0 +1,196 @@
+"""Prometheus-style metrics for Slack calls and tool invocations.
+
+A small in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format, so no client library is needed.
+``serve_metrics`` exposes it on a local HTTP port for scraping; the same
+numbers back the ``slack_server_stats`` tool.
+"""
+import asyncio
+import bisect
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Seconds; the Prometheus client defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """A named family of values keyed by label values"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values: Dict[Labels, float] = {}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in self.values.items():
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {value:g}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        self.values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        # labels -> per-bucket counts (non-cumulative, +Inf last), sum
+        self.counts: Dict[Labels, List[int]] = {}
+        self.sums: Dict[Labels, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = self.counts.get(labels)
+        if counts is None:
+            counts = self.counts[labels] = [0] * (len(self.buckets) + 1)
+            self.sums[labels] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sums[labels] += value
+
+    def summary(self, labels: Labels) -> Dict[str, float]:
+        """Count, mean and bucket-estimated p50/p95/p99 for one label set"""
+        counts = self.counts[labels]
+        total = sum(counts)
+        summary = {"count": total, "avg": round(self.sums[labels] / total, 6) if total else 0.0}
+        for name, quantile in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            seen = 0
+            for i, count in enumerate(counts):
+                seen += count
+                if seen >= quantile * total:
+                    # Upper bound of the bucket holding the quantile
+                    summary[name] = self.buckets[i] if i < len(self.buckets) else float("inf")
+                    break
+        return summary
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, counts in self.counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels + ('le',), labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {self.sums[labels]:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """All metrics of the process, plus collectors that refresh gauges at scrape time"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Iterable[str] = ()) -> Histogram:
+        return self._register(Histogram(name, help, labels))
+
+    def render(self) -> str:
+        for collect in self.collectors:
+            collect()
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+SLACK_REQUEST_SECONDS = REGISTRY.histogram(
+    "slack_api_request_duration_seconds", "Slack Web API HTTP request latency", ("method",)
+)
+SLACK_REQUESTS = REGISTRY.counter(
+    "slack_api_requests_total", "Slack Web API HTTP requests by status code", ("method", "status")
+)
+SLACK_ERRORS = REGISTRY.counter(
+    "slack_api_errors_total", "Slack Web API failures by Slack error code or exception", ("method", "error")
+)
+SLACK_BYTES_SENT = REGISTRY.counter("slack_api_sent_bytes_total", "Request body bytes sent to Slack", ("method",))
+SLACK_BYTES_RECEIVED = REGISTRY.counter(
+    "slack_api_received_bytes_total", "Response body bytes received from Slack", ("method",)
+)
+SLACK_IN_FLIGHT = REGISTRY.gauge("slack_api_in_flight", "Slack Web API requests in flight", ("method",))
+TOOL_SECONDS = REGISTRY.histogram("mcp_tool_duration_seconds", "MCP tool call latency", ("tool",))
+TOOL_CALLS = REGISTRY.counter("mcp_tool_calls_total", "MCP tool calls by outcome", ("tool", "outcome"))
+TOOL_IN_FLIGHT = REGISTRY.gauge("mcp_tool_in_flight", "MCP tool calls in progress", ("tool",))
+
+# Refreshed from the client's component stats at scrape time
+CACHE_ENTRIES = REGISTRY.gauge("slack_cache_entries", "Entries in the response cache")
+CACHE_BYTES = REGISTRY.gauge("slack_cache_bytes", "Approximate bytes held by the response cache")
+CACHE_HIT_RATIO = REGISTRY.gauge("slack_cache_hit_ratio", "Response cache hits / lookups")
+COALESCED_READS = REGISTRY.gauge("slack_coalesced_reads", "Reads that shared an in-flight identical request")
+RETRIES = REGISTRY.gauge("slack_retries", "Slack calls retried after transient failures", ("method",))
+RATE_LIMIT_QUEUED = REGISTRY.gauge("slack_rate_limit_queued", "Calls waiting on the client-side rate limiter")
+RATE_LIMIT_THROTTLED = REGISTRY.gauge("slack_rate_limit_throttled", "429 responses received from Slack")
+OUTBOX_QUEUED = REGISTRY.gauge("slack_outbox_queued", "Queued posts waiting for delivery", ("channel",))
+
+
+async def serve_metrics(host: str, port: int, registry: Optional[Registry] = None) -> asyncio.AbstractServer:
+    """Serve ``GET /metrics`` in the Prometheus text format on host:port"""
+    registry = registry or REGISTRY
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            # Headers are ignored, but must be read before answering
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.split()
+            if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] == b"/metrics":
+                status, body = "200 OK", registry.render().encode()
+            else:
+                status, body = "404 Not Found", b"Not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,209 @@
+"""Asynchronous outbound message queue.
+
+``chat.postMessage`` is limited to about one message per second per channel,
+so an agent posting a burst of updates would block on each one. ``Outbox``
+accepts posts immediately and hands back an id. One sender task per channel
+delivers them in order, channels drain concurrently, and the rate limiter
+paces each channel. With ``coalesce`` on, messages that piled up for the
+same channel and thread are sent as one message; posts with an idempotency
+key are always sent on their own.
+"""
+import asyncio
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+# Slack truncates longer messages; merged text stays under this
+MAX_COALESCED_TEXT = 4000
+
+# Delivered or failed entries kept for status queries
+MAX_FINISHED = 1000
+
+# Seconds close() waits for queued posts before dropping them
+CLOSE_TIMEOUT = 10.0
+
+
+class OutboxEntry:
+    """One queued post and its delivery state"""
+
+    def __init__(self, entry_id: str, body: Dict[str, Any], idempotency_key: Optional[str] = None):
+        self.id = entry_id
+        self.body = body
+        self.idempotency_key = idempotency_key
+        self.state = "queued"
+        self.queued_at = time.time()
+        self.sent_at: Optional[float] = None
+        self.ts: Optional[str] = None
+        self.error: Optional[str] = None
+        # Ids of the entries delivered together with this one
+        self.merged: List[str] = []
+
+    def status(self) -> Dict[str, Any]:
+        status = {
+            "id": self.id,
+            "state": self.state,
+            "channel": self.body["channel"],
+            "queued_at": self.queued_at,
+        }
+        if "thread_ts" in self.body:
+            status["thread_ts"] = self.body["thread_ts"]
+        if self.sent_at is not None:
+            status["sent_at"] = self.sent_at
+        if self.ts is not None:
+            status["ts"] = self.ts
+        if self.error is not None:
+            status["error"] = self.error
+        if self.merged:
+            status["merged"] = self.merged
+        return status
+
+
+class Outbox:
+    """Per-channel ordered delivery of chat.postMessage bodies
+
+    ``send(body, idempotency_key)`` performs the actual post.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Dict[str, Any], Optional[str]], Awaitable[Dict[str, Any]]],
+        coalesce: bool = False
+    ):
+        self.send = send
+        self.coalesce = coalesce
+        self.entries: "OrderedDict[str, OutboxEntry]" = OrderedDict()
+        self._queues: Dict[str, Deque[OutboxEntry]] = {}
+        self._senders: Dict[str, asyncio.Task] = {}
+        self._keys: Dict[str, str] = {}
+        self._ids = itertools.count(1)
+        self.sent = 0
+        self.failed = 0
+        self.coalesced = 0
+
+    def enqueue(self, body: Dict[str, Any], idempotency_key: Optional[str] = None) -> OutboxEntry:
+        """Queue a post and return its entry without waiting for delivery
+
+        A repeated idempotency_key returns the entry queued first, unless
+        that one failed; then the post is queued again.
+        """
+        if idempotency_key:
+            key = self._key(body, idempotency_key)
+            if key in self._keys:
+                return self.entries[self._keys[key]]
+
+        entry = OutboxEntry(f"out-{next(self._ids)}", body, idempotency_key)
+        self.entries[entry.id] = entry
+        if idempotency_key:
+            self._keys[key] = entry.id
+
+        channel = body["channel"]
+        self._queues.setdefault(channel, deque()).append(entry)
+        if channel not in self._senders:
+            self._senders[channel] = asyncio.create_task(self._drain(channel))
+        return entry
+
+    @staticmethod
+    def _key(body: Dict[str, Any], idempotency_key: str) -> str:
+        return f"{body['channel']}/{body.get('thread_ts', '')}/{idempotency_key}"
+
+    @staticmethod
+    def _mergeable(entry: OutboxEntry, thread_ts: Optional[str]) -> bool:
+        return entry.idempotency_key is None and entry.body.get("thread_ts") == thread_ts
+
+    def _next_batch(self, queue: Deque[OutboxEntry]) -> List[OutboxEntry]:
+        batch = [queue.popleft()]
+        thread_ts = batch[0].body.get("thread_ts")
+        if not self.coalesce or not self._mergeable(batch[0], thread_ts):
+            return batch
+        length = len(batch[0].body["text"])
+        while queue and self._mergeable(queue[0], thread_ts):
+            length += len(queue[0].body["text"]) + 1
+            if length > MAX_COALESCED_TEXT:
+                break
+            batch.append(queue.popleft())
+        return batch
+
+    async def _drain(self, channel: str) -> None:
+        queue = self._queues[channel]
+        try:
+            while queue:
+                batch = self._next_batch(queue)
+                body = batch[0].body
+                if len(batch) > 1:
+                    body = {**body, "text": "\n".join(entry.body["text"] for entry in batch)}
+                    self.coalesced += len(batch) - 1
+                for entry in batch:
+                    entry.state = "sending"
+                    entry.merged = [other.id for other in batch if other is not entry]
+
+                try:
+                    response = await self.send(body, batch[0].idempotency_key)
+                    error = None if response.get("ok") else response.get("error", "unknown_error")
+                except Exception as e:
+                    response, error = {}, str(e)
+
+                for entry in batch:
+                    entry.sent_at = time.time()
+                    if error is None:
+                        entry.state, entry.ts = "sent", response.get("ts")
+                        self.sent += 1
+                    else:
+                        self._fail(entry, error)
+                self._forget_finished()
+        finally:
+            del self._senders[channel]
+            if not queue:
+                del self._queues[channel]
+
+    def _fail(self, entry: OutboxEntry, error: str) -> None:
+        entry.state, entry.error = "failed", error
+        self.failed += 1
+        # Like IdempotencyStore, a failed post does not hold on to its key
+        self._release_key(entry)
+
+    def _release_key(self, entry: OutboxEntry) -> None:
+        if entry.idempotency_key:
+            key = self._key(entry.body, entry.idempotency_key)
+            if self._keys.get(key) == entry.id:
+                del self._keys[key]
+
+    def _forget_finished(self) -> None:
+        finished = [entry_id for entry_id, entry in self.entries.items() if entry.state in ("sent", "failed")]
+        for entry_id in finished[:max(0, len(finished) - MAX_FINISHED)]:
+            self._release_key(self.entries.pop(entry_id))
+
+    def status(self, entry_id: str) -> Dict[str, Any]:
+        entry = self.entries.get(entry_id)
+        if entry is None:
+            raise ValueError(f"Unknown outbox message: {entry_id}")
+        return entry.status()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": {channel: len(queue) for channel, queue in self._queues.items() if queue},
+            "sending": sum(entry.state == "sending" for entry in self.entries.values()),
+            "sent": self.sent,
+            "failed": self.failed,
+            "coalesced": self.coalesced,
+        }
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """Give queued posts up to ``timeout`` seconds to go out, then drop the rest
+
+        Dropped entries are marked failed so their status tells the truth; one
+        that was mid-send may or may not have been posted.
+        """
+        senders = list(self._senders.values())
+        if not senders:
+            return
+        _, pending = await asyncio.wait(senders, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for entry in self.entries.values():
+            if entry.state == "queued":
+                self._fail(entry, "outbox closed before delivery")
+            elif entry.state == "sending":
+                self._fail(entry, "outbox closed during delivery; the message may have been posted")
+        self._queues.clear()
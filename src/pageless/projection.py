@@ -0,0 +1,66 @@
+"""Field projection for Slack payloads.
+
+Raw Slack records carry far more than an agent needs (avatar URLs, locale,
+rich text blocks...). Projection keeps only the requested dotted paths so
+tool responses stay small and cheap to serialize. Lists are projected
+element-wise, so ``reactions.name`` works on a message.
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+# Envelope keys every projected response keeps so pagination keeps working
+ENVELOPE_KEYS = ("ok", "error", "warning", "count", "scanned", "has_more", "next_cursor", "response_metadata")
+
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+def compile_fields(fields: List[str]) -> FieldTree:
+    """Turn dotted paths into a nested tree; None marks a fully kept value"""
+    tree: FieldTree = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def _project(value: Any, tree: FieldTree) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, subtree in tree.items():
+        if key in value:
+            projected[key] = value[key] if subtree is None else _project(value[key], subtree)
+    return projected
+
+
+def project_fields(record: Any, fields: List[str]) -> Any:
+    """Keep only the given dotted paths of a record (or list of records)"""
+    return _project(record, compile_fields(fields))
+
+
+def record_projector(fields: Optional[List[str]]) -> Callable[[Any], Any]:
+    """Projection for records handled one at a time; identity for None, [] or ["*"]"""
+    if not fields or "*" in fields:
+        return lambda record: record
+    tree = compile_fields(fields)
+    return lambda record: _project(record, tree)
+
+
+def project_response(response: Dict[str, Any], key: str, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Project the records under ``key`` of a Slack response, keeping the envelope
+
+    ``None``, an empty list or ``["*"]`` leave the response untouched.
+    """
+    if not fields or "*" in fields or key not in response:
+        return response
+    projected = {name: response[name] for name in ENVELOPE_KEYS if name in response}
+    projected[key] = _project(response[key], compile_fields(fields))
+    return projected
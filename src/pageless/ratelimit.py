@@ -0,0 +1,146 @@
+"""Client-side scheduling for Slack's per-method rate limit tiers.
+
+Slack enforces limits per method per workspace, grouped into tiers, plus a
+special per-channel limit for ``chat.postMessage``. ``RateLimiter`` keeps a
+token bucket per (method, channel) key so calls queue up and drain at the
+allowed rate instead of bouncing off 429s.
+"""
+import asyncio
+import time
+from typing import Dict, Any, Optional, Tuple
+
+# Requests per minute and burst size for each Slack rate limit tier
+TIER_LIMITS: Dict[int, Tuple[float, float]] = {
+    1: (1, 1),
+    2: (20, 5),
+    3: (50, 10),
+    4: (100, 20),
+}
+
+METHOD_TIERS: Dict[str, int] = {
+    "conversations.list": 2,
+    "users.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "reactions.add": 3,
+    "users.profile.get": 4,
+}
+
+DEFAULT_TIER = 3
+
+# chat.postMessage is limited to roughly one message per second per channel
+PER_CHANNEL_LIMITS: Dict[str, Tuple[float, float]] = {
+    "chat.postMessage": (60, 1),
+}
+
+RateLimitKey = Tuple[str, Optional[str]]
+
+
+class TokenBucket:
+    """Token bucket refilling at ``rate`` tokens per second up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.queued = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token in FIFO order; returns the seconds spent waiting"""
+        start = time.monotonic()
+        self.queued += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self.blocked_until - now
+                    if delay <= 0:
+                        if self.tokens >= 1:
+                            self.tokens -= 1
+                            break
+                        delay = (1 - self.tokens) / self.rate
+                    await asyncio.sleep(delay)
+        finally:
+            self.queued -= 1
+
+        waited = time.monotonic() - start
+        self.waits += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def block(self, seconds: float) -> None:
+        """Hold every caller back for ``seconds`` after Slack answered 429"""
+        now = time.monotonic()
+        self.throttled += 1
+        self.tokens = 0
+        self.updated = now
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "calls": self.waits,
+            "total_wait": round(self.total_wait, 3),
+            "avg_wait": round(self.total_wait / self.waits, 3) if self.waits else 0.0,
+            "max_wait": round(self.max_wait, 3),
+            "throttled": self.throttled,
+            "blocked_for": round(max(0.0, self.blocked_until - time.monotonic()), 3),
+        }
+
+
+class RateLimiter:
+    """Owns one token bucket per (method, channel) key"""
+
+    def __init__(self, scale: float = 1.0):
+        # scale < 1 leaves headroom for other apps sharing the same token
+        self.scale = scale
+        self._buckets: Dict[RateLimitKey, TokenBucket] = {}
+
+    def key(self, method: str, channel: Optional[str] = None) -> RateLimitKey:
+        """Channel only matters for methods Slack limits per channel"""
+        return (method, channel if method in PER_CHANNEL_LIMITS else None)
+
+    def bucket(self, method: str, channel: Optional[str] = None) -> TokenBucket:
+        key = self.key(method, channel)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if method in PER_CHANNEL_LIMITS:
+                per_minute, burst = PER_CHANNEL_LIMITS[method]
+            else:
+                per_minute, burst = TIER_LIMITS[METHOD_TIERS.get(method, DEFAULT_TIER)]
+            bucket = TokenBucket(per_minute * self.scale / 60, burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, method: str, channel: Optional[str] = None) -> float:
+        """Wait until a call to ``method`` is allowed"""
+        return await self.bucket(method, channel).acquire()
+
+    def retry_after(self, method: str, channel: Optional[str], seconds: float) -> None:
+        """Record a 429 so queued calls wait out Slack's Retry-After"""
+        self.bucket(method, channel).block(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and wait times per key, for spotting throttling"""
+        buckets = {
+            method if channel is None else f"{method}:{channel}": bucket.stats()
+            for (method, channel), bucket in self._buckets.items()
+        }
+        return {
+            "queued": sum(b["queued"] for b in buckets.values()),
+            "throttled": sum(b["throttled"] for b in buckets.values()),
+            "buckets": buckets,
+        }
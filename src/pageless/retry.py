@@ -0,0 +1,65 @@
+"""Retry policy for transient Slack Web API failures.
+
+Network errors, 5xx responses and Slack's transient error codes are
+retried with capped exponential backoff and full jitter, honouring
+``Retry-After`` when the response carries one. 429s are handled separately by
+``SlackClient`` together with the rate limiter. Writes that are not
+idempotent (``chat.postMessage``) are only retried when Slack certainly did
+not act on the request, i.e. the connection was never made.
+"""
+import random
+from typing import Any, Dict, Optional
+
+# Retrying these could post the same message twice
+NON_IDEMPOTENT_METHODS = frozenset({"chat.postMessage"})
+
+# ok: false error codes Slack documents as temporary
+TRANSIENT_ERRORS = frozenset({"internal_error", "fatal_error", "service_unavailable", "request_timeout"})
+
+
+class RetryPolicy:
+    """Decides whether and how long to wait before retrying a Slack call"""
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.5, max_delay: float = 30.0):
+        # Retries after the first attempt; 0 disables retrying
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self.retried: Dict[str, int] = {}
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def should_retry_error(self, method: str, attempt: int, error: Exception) -> bool:
+        """Retry an httpx exception raised before any response arrived"""
+        import httpx
+
+        if attempt >= self.attempts:
+            return False
+        if method in NON_IDEMPOTENT_METHODS:
+            # A timeout or dropped connection after sending may still have posted
+            return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+        return isinstance(error, httpx.TransportError)
+
+    def should_retry_response(self, method: str, attempt: int, status: int, body: Any) -> bool:
+        """Retry a 5xx or a transient ok: false error"""
+        if attempt >= self.attempts or method in NON_IDEMPOTENT_METHODS:
+            return False
+        if status >= 500:
+            return True
+        return isinstance(body, dict) and not body.get("ok", True) and body.get("error") in TRANSIENT_ERRORS
+
+    def record(self, method: str) -> None:
+        self.retries += 1
+        self.retried[method] = self.retried.get(method, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "retried": dict(self.retried),
+        }
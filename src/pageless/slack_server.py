@@ -1,139 +1,982 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
 import json
-from typing import Dict, Any, Optional, List
-import httpx
-from mcp.server.fastmcp import FastMCP
+import time
+import asyncio
+import argparse
+import functools
+import importlib.util
+from collections import defaultdict
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, Any, Callable, Optional, List, AsyncIterator
+from pageless.cache import SingleFlight, TTLCache
+from pageless.coordinator import Coordinator, CoordinatorClient, SharedCache, SharedRateLimiter
+from pageless.directory import NameIndex
+from pageless.filters import MessageFilter
+from pageless.idempotency import IdempotencyStore
+from pageless.jsonstream import RecordStream
+from pageless import metrics
+from pageless.tracing import FileExporter, Tracer
+from pageless.outbox import CLOSE_TIMEOUT, Outbox
+from pageless.projection import project_response, record_projector
+from pageless.ratelimit import RateLimiter
+from pageless.retry import RetryPolicy
+from pageless.store import ChannelState, MessageStore
 
-# Check for required environment variables
-bot_token = os.environ.get("SLACK_BOT_TOKEN")
-team_id = os.environ.get("SLACK_TEAM_ID")
+# httpx and the FastMCP stack are imported where first needed so importing
+# this module (and starting the server) stays cheap
+if TYPE_CHECKING:
+    import httpx
+    from mcp.server.fastmcp import FastMCP
 
-if not bot_token or not team_id:
-    print("Please set SLACK_BOT_TOKEN and SLACK_TEAM_ID environment variables", file=sys.stderr)
-    sys.exit(1)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-print("Starting Slack MCP Server...", file=sys.stderr)
+DEFAULT_API_URL = "https://slack.com/api"
 
-# Initialize FastMCP server
-mcp = FastMCP("Slack MCP Server")
+def _env_bool(environ: Dict[str, str], name: str, default: str) -> bool:
+    return environ.get(name, default).lower() in ("1", "true", "yes")
+
+@dataclass
+class Settings:
+    """Server configuration, read from SLACK_* environment variables"""
+    
+    bot_token: str
+    team_id: str
+    
+    # Base URL of the Web API, e.g. a local caching proxy or egress gateway
+    api_url: str = DEFAULT_API_URL
+    
+    # Connection pool settings for the shared Slack HTTP client
+    http_max_connections: int = 20
+    http_max_keepalive: int = 10
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 30.0
+    # HTTP/2 needs the h2 package, which the project does not depend on
+    # (install httpx[http2] alongside it). SLACK_HTTP2 defaults to whether h2
+    # is installed; set to true without h2, the client stays on HTTP/1.1 and
+    # main says so at startup
+    http2: bool = True
+    # Maximum concurrent Slack calls a single batch tool fans out to
+    batch_concurrency: int = 8
+    
+    # Client-side scheduling against Slack's per-method rate limit tiers
+    rate_limit: bool = True
+    rate_limit_scale: float = 1.0
+    rate_limit_retries: int = 3
+    
+    # Backoff for network errors, 5xx and transient Slack errors; 0 disables
+    retry_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30.0
+    
+    # Share one Slack request among concurrent identical read calls
+    coalesce: bool = True
+    
+    # In-memory cache for user profiles and the user directory
+    cache: bool = True
+    cache_ttl: float = 300.0
+    cache_max_entries: int = 1000
+    cache_max_bytes: int = 16 * 1024 * 1024
+    
+    # Optional SQLite message store: only messages newer than the last read
+    # are fetched from Slack; at most every store_reconcile_interval seconds a
+    # read also re-fetches the look-back window to pick up edits and deletes
+    store_path: Optional[str] = None
+    store_lookback: float = 300.0
+    store_reconcile_interval: float = 60.0
+    # Most conversations.history pages one read spends catching up on what
+    # is new; a longer gap drops the channel's stored copy and starts over
+    store_catchup_pages: int = 5
+    
+    # Responses of posts made with an idempotency_key, replayed when the key
+    # is reused; idempotency_path also keeps them on disk
+    idempotency_ttl: float = 86400.0
+    idempotency_max_entries: int = 10000
+    idempotency_path: Optional[str] = None
+    
+    # Queued posts (queued=true) that pile up for one channel and thread are
+    # merged into a single message
+    outbox_coalesce: bool = False
+    
+    # Decode full-listing pages (history windows, all channels, all users)
+    # record by record as the body arrives instead of buffering each page;
+    # users.list pages keep going through the cache while it is enabled
+    stream_decode: bool = True
+    
+    # How often the #channel / @user name index is rebuilt in the background
+    name_index_refresh: float = 600.0
+    
+    # Default field projection per read tool, e.g.
+    # {"slack_get_users": ["id", "name", "profile.real_name"]}
+    default_fields: Dict[str, List[str]] = field(default_factory=dict)
+    
+    # Local port serving Prometheus metrics at /metrics; None disables it
+    metrics_port: Optional[int] = None
+    metrics_host: str = "127.0.0.1"
+    
+    # Append OpenTelemetry-compatible spans (OTLP/JSON, one per line) here
+    trace_file: Optional[str] = None
+    
+    # Record every Slack request/response pair to a cassette file (gzip when
+    # it ends in .gz), or serve Slack calls from one instead of the network;
+    # cassette_speed scales replayed latency, 0 answers immediately
+    cassette_record: Optional[str] = None
+    cassette_replay: Optional[str] = None
+    cassette_speed: float = 1.0
+    
+    # JSON backend for decoding Slack responses and encoding tool results:
+    # "auto" uses orjson when it is installed, "json" forces the stdlib
+    json_backend: str = "auto"
+    
+    @classmethod
+    def from_env(cls, environ: Optional[Dict[str, str]] = None) -> "Settings":
+        """Build settings from the environment; raises ValueError if tokens are missing"""
+        environ = os.environ if environ is None else environ
+        bot_token = environ.get("SLACK_BOT_TOKEN")
+        team_id = environ.get("SLACK_TEAM_ID")
+        
+        if not bot_token or not team_id:
+            raise ValueError("Please set SLACK_BOT_TOKEN and SLACK_TEAM_ID environment variables")
+        
+        return cls(
+            bot_token=bot_token,
+            team_id=team_id,
+            api_url=environ.get("SLACK_API_URL", DEFAULT_API_URL),
+            http_max_connections=int(environ.get("SLACK_HTTP_MAX_CONNECTIONS", "20")),
+            http_max_keepalive=int(environ.get("SLACK_HTTP_MAX_KEEPALIVE", "10")),
+            http_keepalive_expiry=float(environ.get("SLACK_HTTP_KEEPALIVE_EXPIRY", "30")),
+            http_timeout=float(environ.get("SLACK_HTTP_TIMEOUT", "30")),
+            http2=_env_bool(environ, "SLACK_HTTP2", str(importlib.util.find_spec("h2") is not None)),
+            batch_concurrency=int(environ.get("SLACK_BATCH_CONCURRENCY", "8")),
+            rate_limit=_env_bool(environ, "SLACK_RATE_LIMIT", "true"),
+            rate_limit_scale=float(environ.get("SLACK_RATE_LIMIT_SCALE", "1.0")),
+            rate_limit_retries=int(environ.get("SLACK_RATE_LIMIT_RETRIES", "3")),
+            retry_attempts=int(environ.get("SLACK_RETRY_ATTEMPTS", "3")),
+            retry_base_delay=float(environ.get("SLACK_RETRY_BASE_DELAY", "0.5")),
+            retry_max_delay=float(environ.get("SLACK_RETRY_MAX_DELAY", "30")),
+            coalesce=_env_bool(environ, "SLACK_COALESCE", "true"),
+            cache=_env_bool(environ, "SLACK_CACHE", "true"),
+            cache_ttl=float(environ.get("SLACK_CACHE_TTL", "300")),
+            cache_max_entries=int(environ.get("SLACK_CACHE_MAX_ENTRIES", "1000")),
+            cache_max_bytes=int(environ.get("SLACK_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+            store_path=environ.get("SLACK_STORE_PATH"),
+            store_lookback=float(environ.get("SLACK_STORE_LOOKBACK", "300")),
+            store_reconcile_interval=float(environ.get("SLACK_STORE_RECONCILE_INTERVAL", "60")),
+            store_catchup_pages=int(environ.get("SLACK_STORE_CATCHUP_PAGES", "5")),
+            idempotency_ttl=float(environ.get("SLACK_IDEMPOTENCY_TTL", "86400")),
+            idempotency_max_entries=int(environ.get("SLACK_IDEMPOTENCY_MAX_ENTRIES", "10000")),
+            idempotency_path=environ.get("SLACK_IDEMPOTENCY_PATH"),
+            outbox_coalesce=_env_bool(environ, "SLACK_OUTBOX_COALESCE", "false"),
+            stream_decode=_env_bool(environ, "SLACK_STREAM_DECODE", "true"),
+            name_index_refresh=float(environ.get("SLACK_NAME_INDEX_REFRESH", "600")),
+            default_fields=json.loads(environ.get("SLACK_DEFAULT_FIELDS", "{}")),
+            metrics_port=int(environ["SLACK_METRICS_PORT"]) if environ.get("SLACK_METRICS_PORT") else None,
+            metrics_host=environ.get("SLACK_METRICS_HOST", "127.0.0.1"),
+            trace_file=environ.get("SLACK_TRACE_FILE"),
+            cassette_record=environ.get("SLACK_CASSETTE_RECORD"),
+            cassette_replay=environ.get("SLACK_CASSETTE_REPLAY"),
+            cassette_speed=float(environ.get("SLACK_CASSETTE_SPEED", "1.0")),
+            json_backend=environ.get("SLACK_JSON", "auto")
+        )
+
+class SlackAPIError(Exception):
+    """Raised when Slack answers ok: false partway through a multi-call operation"""
+
+class SlackResponse(dict):
+    """Decoded Slack response that remembers the raw body it came from
+    
+    Tools that return a response unmodified serialize it by reusing the
+    raw bytes instead of re-encoding the dict, so treat it as read-only
+    and build a new dict when a result needs changing.
+    """
+    
+    def __init__(self, data: Dict[str, Any], raw: bytes):
+        super().__init__(data)
+        self.raw = raw
+
+class JSONSerializer:
+    """Pluggable JSON encode/decode, backed by orjson when available"""
+    
+    def __init__(self, backend: str = "auto"):
+        if backend == "orjson" and orjson is None:
+            raise ValueError("SLACK_JSON=orjson but orjson is not installed")
+        self.use_orjson = orjson is not None and backend in ("auto", "orjson")
+    
+    def loads(self, body: bytes) -> Any:
+        if self.use_orjson:
+            return orjson.loads(body)
+        return json.loads(body)
+    
+    def dumps(self, obj: Any) -> str:
+        if isinstance(obj, SlackResponse):
+            return obj.raw.decode()
+        if self.use_orjson:
+            return orjson.dumps(obj).decode()
+        return json.dumps(obj)
+
+serializer = JSONSerializer()
+# Replaced by create_app when SLACK_TRACE_FILE is set; a no-op otherwise
+tracer = Tracer()
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result with the configured JSON backend"""
+    with tracer.span("json.encode"):
+        return serializer.dumps(obj)
+
+def tool_fields(tool: str, fields: Optional[List[str]]) -> Optional[List[str]]:
+    """Fields requested by the caller, falling back to the server default for the tool"""
+    return settings.default_fields.get(tool) if fields is None else fields
 
 class SlackClient:
-    def __init__(self, bot_token: str):
+    def __init__(
+        self,
+        bot_token: str,
+        team_id: Optional[str] = None,
+        base_url: str = DEFAULT_API_URL,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        limits: Optional["httpx.Limits"] = None,
+        http2: bool = True,
+        timeout: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_retries: int = 3,
+        retry: Optional[RetryPolicy] = None,
+        coalesce: bool = True,
+        stream: bool = True,
+        cache: Optional[TTLCache] = None,
+        store: Optional[MessageStore] = None,
+        store_lookback: float = 300.0,
+        store_reconcile_interval: float = 60.0,
+        store_catchup_pages: int = 5,
+        idempotency: Optional[IdempotencyStore] = None,
+        outbox_coalesce: bool = False,
+        name_index_refresh: float = 600.0
+    ):
         self.bot_headers = {
             "Authorization": f"Bearer {bot_token}",
             "Content-Type": "application/json"
         }
+        self.team_id = team_id
+        self.base_url = base_url.rstrip("/")
+        # A custom transport (replay, mock, proxy) replaces the network; the
+        # pool and HTTP/2 settings only apply to the default one
+        self.transport = transport
+        self.limits = limits
+        self.timeout = timeout
+        # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._client: Optional["httpx.AsyncClient"] = None
+        # Calls queue on the limiter instead of failing; 429s are retried
+        # after Slack's Retry-After up to rate_limit_retries times
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = rate_limit_retries
+        self.retry = retry
+        # Identical reads already in flight share one request and decoded result
+        self._flight = SingleFlight() if coalesce else None
+        self.reads = 0
+        # Paging iterators decode records incrementally with RecordStream
+        self.stream = stream
+        self.cache = cache
+        self.store = store
+        self.store_lookback = store_lookback
+        self.store_reconcile_interval = store_reconcile_interval
+        self.store_catchup_pages = store_catchup_pages
+        self._store_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.idempotency = idempotency or IdempotencyStore()
+        self.outbox = Outbox(self._post_once, coalesce=outbox_coalesce)
+        self.names = NameIndex(self.iter_channels, self.iter_users, name_index_refresh)
+    
+    async def start(self) -> None:
+        """Open the shared connection pool used by every Slack API call"""
+        if self._client is None:
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                headers=self.bot_headers,
+                limits=self.limits or httpx.Limits(),
+                http2=self.http2,
+                timeout=self.timeout,
+                transport=self.transport
+            )
+    
+    async def aclose(self) -> None:
+        """Deliver queued posts, then close the shared connection pool
+        
+        Called once at process shutdown (see serve), not when sessions end,
+        so queued posts outlive the session that queued them.
+        """
+        await self.outbox.close()
+        self.names.close()
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+        if self.store is not None:
+            self.store.close()
+        self.idempotency.close()
+    
+    async def _request(self, verb: str, method: str, channel: Optional[str], **kwargs: Any) -> Dict[str, Any]:
+        """Send a Slack Web API call, scheduled through the rate limiter
+        
+        429s are retried after Slack's Retry-After; network errors, 5xx and
+        transient Slack errors go through the retry policy.
+        """
+        import httpx
+        
+        await self.start()
+        attempt = 0
+        throttled = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(method, channel)
+            try:
+                response = await self._send(verb, method, **kwargs)
+            except httpx.TransportError as e:
+                if self.retry is None or not self.retry.should_retry_error(method, attempt, e):
+                    raise
+                delay = self.retry.backoff(attempt)
+            else:
+                if response.status_code == 429 and throttled < self.rate_limit_retries:
+                    retry_after = float(response.headers.get("Retry-After", "1"))
+                    throttled += 1
+                    if self.rate_limiter is not None:
+                        # Blocks the bucket, so the next acquire waits out Retry-After
+                        self.rate_limiter.retry_after(method, channel, retry_after)
+                    else:
+                        await asyncio.sleep(retry_after)
+                    continue
+                
+                try:
+                    with tracer.span("json.decode", **{"http.response.body.size": len(response.content)}):
+                        body = serializer.loads(response.content)
+                except ValueError:
+                    # 5xx from a proxy in front of Slack is often not JSON
+                    body = None
+                if isinstance(body, dict) and not body.get("ok", True):
+                    metrics.SLACK_ERRORS.inc(method, str(body.get("error")))
+                if self.retry is None or not self.retry.should_retry_response(method, attempt, response.status_code, body):
+                    if not isinstance(body, dict):
+                        raise SlackAPIError(f"{method} failed with HTTP {response.status_code}")
+                    return SlackResponse(body, response.content)
+                retry_after = response.headers.get("Retry-After")
+                delay = self.retry.backoff(attempt, float(retry_after) if retry_after else None)
+            
+            self.retry.record(method)
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def _send(self, verb: str, method: str, **kwargs: Any) -> "httpx.Response":
+        """One HTTP round trip to Slack, recorded in the metrics"""
+        metrics.SLACK_IN_FLIGHT.inc(method)
+        start = time.perf_counter()
+        try:
+            with tracer.span(f"slack {method}", **{"http.request.method": verb, "slack.method": method}) as span:
+                if tracer.enabled:
+                    # httpcore reports connect, TLS and request/response phases
+                    kwargs["extensions"] = {"trace": tracer.http_trace()}
+                response = await self._client.request(verb, f"{self.base_url}/{method}", **kwargs)
+                span.set("http.response.status_code", response.status_code)
+        except Exception as e:
+            metrics.SLACK_ERRORS.inc(method, type(e).__name__)
+            raise
+        finally:
+            metrics.SLACK_REQUEST_SECONDS.observe(time.perf_counter() - start, method)
+            metrics.SLACK_IN_FLIGHT.dec(method)
+        metrics.SLACK_REQUESTS.inc(method, str(response.status_code))
+        metrics.SLACK_BYTES_SENT.inc(method, amount=len(response.request.content))
+        metrics.SLACK_BYTES_RECEIVED.inc(method, amount=len(response.content))
+        return response
+    
+    async def _stream_page(
+        self,
+        method: str,
+        params: Dict[str, str],
+        key: str,
+        envelope: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """GET one page, yielding the records under key as they are decoded
+        
+        The rest of the response (ok, error, response_metadata...) is put in
+        envelope once the body is done. Network errors and transient ok:
+        false answers go through the retry policy as long as no record was
+        yielded yet; once one was, a body that breaks off raises instead.
+        Any status but 200 is handed to _request, which deals with 429s and
+        5xx as usual.
+        """
+        import httpx
+        
+        await self.start()
+        channel = params.get("channel")
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(method, channel)
+            metrics.SLACK_IN_FLIGHT.inc(method)
+            start = time.perf_counter()
+            # Not entered as a context manager: the caller runs between records
+            span = tracer.span(
+                f"slack {method}", **{"http.request.method": "GET", "slack.method": method, "slack.stream": True}
+            )
+            stream = RecordStream(key)
+            error: Optional[BaseException] = None
+            try:
+                async with self._client.stream("GET", f"{self.base_url}/{method}", params=params) as response:
+                    span.set("http.response.status_code", response.status_code)
+                    if response.status_code == 200:
+                        async for chunk in response.aiter_bytes():
+                            for record in stream.feed(chunk):
+                                yield record
+                        envelope.update(stream.close())
+                        span.set("slack.records", stream.records)
+            except Exception as e:
+                error = e
+                metrics.SLACK_ERRORS.inc(method, type(e).__name__)
+                if (
+                    not isinstance(e, httpx.TransportError) or stream.records or self.retry is None
+                    or not self.retry.should_retry_error(method, attempt, e)
+                ):
+                    raise
+            finally:
+                span.end(error)
+                metrics.SLACK_REQUEST_SECONDS.observe(time.perf_counter() - start, method)
+                metrics.SLACK_IN_FLIGHT.dec(method)
+            
+            if error is None:
+                metrics.SLACK_REQUESTS.inc(method, str(response.status_code))
+                metrics.SLACK_BYTES_RECEIVED.inc(method, amount=response.num_bytes_downloaded)
+                if response.status_code != 200:
+                    break
+                if envelope.get("ok", True):
+                    return
+                metrics.SLACK_ERRORS.inc(method, str(envelope.get("error")))
+                if (
+                    stream.records or self.retry is None
+                    or not self.retry.should_retry_response(method, attempt, 200, envelope)
+                ):
+                    return
+                envelope.clear()
+            
+            delay = self.retry.backoff(attempt)
+            self.retry.record(method)
+            attempt += 1
+            await asyncio.sleep(delay)
+        
+        if response.status_code == 429:
+            retry_after = float(response.headers.get("Retry-After", "1"))
+            if self.rate_limiter is not None:
+                self.rate_limiter.retry_after(method, channel, retry_after)
+            else:
+                await asyncio.sleep(retry_after)
+        page = await self._request("GET", method, channel, params=params)
+        envelope.update((name, value) for name, value in page.items() if name != key)
+        for record in page.get(key, []):
+            yield record
+    
+    async def _iter_stream(self, method: str, params: Dict[str, str], key: str) -> AsyncIterator[Dict[str, Any]]:
+        """Like _iter_pages, but each page is decoded record by record as it arrives"""
+        params = dict(params)
+        while True:
+            envelope: Dict[str, Any] = {}
+            async for record in self._stream_page(method, params, key, envelope):
+                yield record
+            if not envelope.get("ok"):
+                raise SlackAPIError(envelope.get("error", "unknown_error"))
+            cursor = envelope.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+    
+    async def _get(self, method: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """Call a read-style Slack Web API method with query parameters
+        
+        Concurrent calls with the same method and parameters are coalesced,
+        so every caller gets the same (read-only) SlackResponse.
+        """
+        self.reads += 1
+        if self._flight is None:
+            return await self._request("GET", method, params.get("channel"), params=params)
+        key = (method, tuple(sorted((name, value) for name, value in params.items() if value is not None)))
+        return await self._flight.do(
+            key, lambda: self._request("GET", method, params.get("channel"), params=params)
+        )
+    
+    def coalesce_stats(self) -> Dict[str, Any]:
+        """Read calls made, how many shared an in-flight request, and how many are in flight"""
+        coalesced = self._flight.shared if self._flight is not None else 0
+        return {
+            "enabled": self._flight is not None,
+            "reads": self.reads,
+            "coalesced": coalesced,
+            "coalesced_ratio": round(coalesced / self.reads, 3) if self.reads else 0.0,
+            "in_flight": self._flight.in_flight() if self._flight is not None else 0,
+        }
+    
+    async def _cached(self, key: Any, method: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """_get through the response cache; only ok responses are stored"""
+        if self.cache is None:
+            return await self._get(method, params)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._get(method, params),
+            cacheable=lambda response: bool(response.get("ok"))
+        )
+    
+    async def _post(self, method: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a write-style Slack Web API method with a JSON body"""
+        return await self._request("POST", method, body.get("channel"), json=body)
     
     async def get_channels(self, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
         """List public channels in the workspace with pagination"""
+        return await self._get("conversations.list", self._channels_params(limit, cursor))
+    
+    def _channels_params(self, limit: int, cursor: Optional[str] = None) -> Dict[str, str]:
         params = {
             "types": "public_channel",
             "exclude_archived": "true",
             "limit": str(min(limit, 200)),
-            "team_id": team_id
+            "team_id": self.team_id
         }
         
         if cursor:
             params["cursor"] = cursor
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://slack.com/api/conversations.list",
-                headers=self.bot_headers,
-                params=params
-            )
-            return response.json()
+        return params
     
-    async def post_message(self, channel_id: str, text: str) -> Dict[str, Any]:
+    async def post_message(self, channel_id: str, text: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """Post a new message to a Slack channel"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://slack.com/api/chat.postMessage",
-                headers=self.bot_headers,
-                json={
-                    "channel": channel_id,
-                    "text": text
-                }
-            )
-            return response.json()
+        body = {
+            "channel": channel_id,
+            "text": text
+        }
+        
+        return await self._post_once(body, idempotency_key)
     
-    async def post_reply(self, channel_id: str, thread_ts: str, text: str) -> Dict[str, Any]:
+    async def post_reply(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        text: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Reply to a specific message thread in Slack"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://slack.com/api/chat.postMessage",
-                headers=self.bot_headers,
-                json={
-                    "channel": channel_id,
-                    "thread_ts": thread_ts,
-                    "text": text
-                }
-            )
-            return response.json()
+        body = {
+            "channel": channel_id,
+            "thread_ts": thread_ts,
+            "text": text
+        }
+        
+        return await self._post_once(body, idempotency_key)
+    
+    def queue_message(
+        self,
+        channel_id: str,
+        text: str,
+        thread_ts: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue a message or thread reply on the outbox and return its status right away"""
+        body = {
+            "channel": channel_id,
+            "text": text
+        }
+        
+        if thread_ts:
+            body["thread_ts"] = thread_ts
+        
+        return {"ok": True, **self.outbox.enqueue(body, idempotency_key).status()}
+    
+    async def _post_once(self, body: Dict[str, Any], idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """chat.postMessage, replaying the earlier response if idempotency_key was already used"""
+        if not idempotency_key:
+            return await self._post("chat.postMessage", body)
+        # Keys are scoped to the channel and thread they post to
+        key = f"{body['channel']}/{body.get('thread_ts', '')}/{idempotency_key}"
+        return await self.idempotency.post_once(key, lambda: self._post("chat.postMessage", body))
     
     async def add_reaction(self, channel_id: str, timestamp: str, reaction: str) -> Dict[str, Any]:
         """Add a reaction emoji to a message"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://slack.com/api/reactions.add",
-                headers=self.bot_headers,
-                json={
-                    "channel": channel_id,
-                    "timestamp": timestamp,
-                    "name": reaction
-                }
-            )
-            return response.json()
+        body = {
+            "channel": channel_id,
+            "timestamp": timestamp,
+            "name": reaction
+        }
+        
+        return await self._post("reactions.add", body)
     
-    async def get_channel_history(self, channel_id: str, limit: int = 10) -> Dict[str, Any]:
-        """Get recent messages from a channel"""
+    async def add_reactions(self, reactions: List[Dict[str, str]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Add many reactions concurrently; results come back in input order
+        
+        Each item has channel_id, timestamp and reaction. A reaction that is
+        already there counts as success, and a failing item only fails its
+        own entry.
+        """
+        import httpx
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def react(item: Dict[str, str]) -> Dict[str, Any]:
+            missing = [name for name in ("channel_id", "timestamp", "reaction") if not item.get(name)]
+            if missing:
+                return {"ok": False, "error": f"Missing required fields: {', '.join(missing)}"}
+            async with semaphore:
+                try:
+                    channel_id = await self.names.resolve_channel(item["channel_id"])
+                    response = await self.add_reaction(channel_id, item["timestamp"], item["reaction"])
+                except (ValueError, SlackAPIError, httpx.HTTPError) as e:
+                    return {"ok": False, "error": str(e)}
+            if response.get("error") == "already_reacted":
+                return {"ok": True, "already_reacted": True}
+            if not response.get("ok"):
+                return {"ok": False, "error": response.get("error", "unknown_error")}
+            return {"ok": True}
+        
+        return list(await asyncio.gather(*(react(item) for item in reactions)))
+    
+    async def get_channel_history(
+        self,
+        channel_id: str,
+        limit: int = 10,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get recent messages from a channel, optionally within a time window
+        
+        Without a window, recent history comes from the message store when
+        there is one; its next_cursor is "before:<ts>", which this method
+        also accepts. Code paging through history uses _fetch_history.
+        """
+        if cursor and cursor.startswith("before:"):
+            latest, cursor = cursor[len("before:"):], None
+        if self.store is not None and not (oldest or latest or inclusive or cursor):
+            return await self._get_stored_history(channel_id, limit)
+        return await self._fetch_history(channel_id, limit, oldest, latest, inclusive, cursor)
+    
+    async def _fetch_history(
+        self,
+        channel_id: str,
+        limit: int = 10,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Call conversations.history directly, bypassing the message store"""
+        return await self._get(
+            "conversations.history", self._history_params(channel_id, limit, oldest, latest, inclusive, cursor)
+        )
+    
+    def _history_params(
+        self,
+        channel_id: str,
+        limit: int,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False,
+        cursor: Optional[str] = None
+    ) -> Dict[str, str]:
         params = {
             "channel": channel_id,
             "limit": str(limit)
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://slack.com/api/conversations.history",
-                headers=self.bot_headers,
-                params=params
-            )
-            return response.json()
+        if oldest:
+            params["oldest"] = oldest
+        if latest:
+            params["latest"] = latest
+        if inclusive:
+            params["inclusive"] = "true"
+        if cursor:
+            params["cursor"] = cursor
+        
+        return params
+    
+    async def _get_stored_history(self, channel_id: str, limit: int) -> Dict[str, Any]:
+        """Serve recent history from the message store, syncing it incrementally
+        
+        Each read fetches only messages newer than the newest stored one; at
+        most once per store_reconcile_interval it re-fetches the look-back
+        window instead, so edits and deletes are picked up.
+        """
+        async with self._store_locks[channel_id]:
+            state = await self.store.state(channel_id)
+            now = time.time()
+            if state is not None:
+                reconcile = now - state.reconciled_at >= self.store_reconcile_interval
+                if reconcile:
+                    since = f"{max(0.0, float(state.newest_ts) - self.store_lookback):.6f}"
+                else:
+                    since = state.newest_ts
+                fresh: List[Dict[str, Any]] = []
+                cursor = None
+                for _ in range(self.store_catchup_pages):
+                    response = await self._fetch_history(channel_id, 200, oldest=since, cursor=cursor)
+                    if not response.get("ok"):
+                        return response
+                    fresh.extend(response.get("messages", []))
+                    cursor = response.get("response_metadata", {}).get("next_cursor")
+                    if not cursor:
+                        break
+                else:
+                    # Too far behind to catch up cheaply; start over from the newest page
+                    await self.store.reset(channel_id)
+                    state = None
+            
+            if state is None:
+                response = await self._fetch_history(channel_id, limit)
+                if response.get("ok"):
+                    messages = response.get("messages", [])
+                    await self.store.upsert(channel_id, messages)
+                    timestamps = [m["ts"] for m in messages if "ts" in m]
+                    await self.store.set_state(channel_id, ChannelState(
+                        max(timestamps, default="0"),
+                        min(timestamps, default="0"),
+                        not response.get("has_more"),
+                        now
+                    ))
+                return response
+            
+            if reconcile:
+                await self.store.sync_window(channel_id, since, fresh)
+                state.reconciled_at = now
+            else:
+                await self.store.upsert(channel_id, fresh)
+            state.newest_ts = max([state.newest_ts] + [m["ts"] for m in fresh if "ts" in m])
+            
+            # Backfill older messages when the store holds fewer than requested
+            count = await self.store.count(channel_id)
+            while count < limit and not state.complete:
+                response = await self._fetch_history(channel_id, min(200, limit - count), latest=state.oldest_ts)
+                if not response.get("ok"):
+                    return response
+                older = response.get("messages", [])
+                await self.store.upsert(channel_id, older)
+                state.oldest_ts = min([state.oldest_ts] + [m["ts"] for m in older if "ts" in m])
+                state.complete = not response.get("has_more")
+                count += len(older)
+            await self.store.set_state(channel_id, state)
+            
+            messages = await self.store.recent(channel_id, limit)
+            has_more = count > limit or not state.complete
+            response = {"ok": True, "messages": messages, "has_more": has_more}
+            if has_more and messages:
+                response["response_metadata"] = {"next_cursor": f"before:{messages[-1]['ts']}"}
+            return response
+    
+    async def iter_channel_history(
+        self,
+        channel_id: str,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every message in a time window, newest first, page by page"""
+        async def fetch(limit: int, cursor: Optional[str]) -> Dict[str, Any]:
+            return await self._fetch_history(channel_id, limit, oldest, latest, inclusive, cursor)
+        
+        if self.stream:
+            params = self._history_params(channel_id, 200, oldest, latest, inclusive)
+            pages = self._iter_stream("conversations.history", params, "messages")
+        else:
+            pages = self._iter_pages(fetch, "messages")
+        async for message in pages:
+            yield message
+    
+    async def get_filtered_history(
+        self,
+        channel_id: str,
+        message_filter: MessageFilter,
+        limit: int = 10,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False,
+        cursor: Optional[str] = None,
+        max_scan: int = 1000
+    ) -> Dict[str, Any]:
+        """Page back through history keeping only messages that pass message_filter
+        
+        Stops after limit matches or max_scan scanned messages. Matches stop
+        mid-page, so next_cursor ("before:<ts>") resumes just after the last
+        scanned message rather than being a Slack cursor.
+        """
+        before = None
+        if cursor:
+            if not cursor.startswith("before:"):
+                raise ValueError("cursor must be a next_cursor returned by a filtered history call")
+            before = latest = cursor[len("before:"):]
+        
+        messages: List[Dict[str, Any]] = []
+        scanned = 0
+        last_ts = before
+        exhausted = False
+        async with aclosing(self.iter_channel_history(channel_id, oldest, latest, inclusive)) as history:
+            async for message in history:
+                if before is not None and message.get("ts") == before:
+                    # inclusive repeats the message the previous call ended on
+                    continue
+                scanned += 1
+                last_ts = message.get("ts", last_ts)
+                if message_filter.matches(message):
+                    messages.append(message)
+                if len(messages) >= limit or scanned >= max_scan:
+                    break
+            else:
+                exhausted = True
+        
+        return {
+            "ok": True,
+            "messages": messages,
+            "scanned": scanned,
+            "has_more": not exhausted,
+            "next_cursor": None if exhausted else f"before:{last_ts}"
+        }
     
-    async def get_thread_replies(self, channel_id: str, thread_ts: str) -> Dict[str, Any]:
+    async def get_channel_history_range(
+        self,
+        channel_id: str,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        inclusive: bool = False,
+        max_messages: int = 1000,
+        cursor: Optional[str] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """Get up to max_messages from a time window across as many pages as needed
+        
+        next_cursor in the result continues the window where this call stopped.
+        transform (e.g. a field projection) is applied to each message as it
+        is decoded, so whole pages of full records are never held at once.
+        """
+        transform = transform or (lambda message: message)
+        messages: List[Any] = []
+        while len(messages) < max_messages:
+            limit = min(200, max_messages - len(messages))
+            if self.stream:
+                params = self._history_params(channel_id, limit, oldest, latest, inclusive, cursor)
+                response: Dict[str, Any] = {}
+                async for message in self._stream_page("conversations.history", params, "messages", response):
+                    messages.append(transform(message))
+            else:
+                response = await self._fetch_history(channel_id, limit, oldest, latest, inclusive, cursor)
+                messages.extend(transform(message) for message in response.get("messages", []))
+            if not response.get("ok"):
+                raise SlackAPIError(response.get("error", "unknown_error"))
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor or not response.get("has_more"):
+                cursor = None
+                break
+        
+        return {"ok": True, "messages": messages, "has_more": cursor is not None, "next_cursor": cursor}
+    
+    async def get_thread_replies(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get all replies in a message thread"""
         params = {
             "channel": channel_id,
             "ts": thread_ts
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://slack.com/api/conversations.replies",
-                headers=self.bot_headers,
-                params=params
-            )
-            return response.json()
+        if limit:
+            params["limit"] = str(limit)
+        if cursor:
+            params["cursor"] = cursor
+        
+        return await self._get("conversations.replies", params)
+    
+    async def iter_thread_replies(self, channel_id: str, thread_ts: str) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every message in a thread, following pagination"""
+        # Slack repeats the parent message at the top of every page
+        seen = set()
+        fetch = functools.partial(self.get_thread_replies, channel_id, thread_ts)
+        async for message in self._iter_pages(fetch, "messages"):
+            if message.get("ts") not in seen:
+                seen.add(message.get("ts"))
+                yield message
+    
+    async def get_threads(
+        self,
+        channel_id: str,
+        thread_ts_list: List[str],
+        concurrency: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch many complete threads concurrently, keyed by thread_ts
+        
+        A failing thread is reported in its own entry instead of failing
+        the whole batch.
+        """
+        import httpx
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(thread_ts: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    messages = [m async for m in self.iter_thread_replies(channel_id, thread_ts)]
+                except (SlackAPIError, httpx.HTTPError) as e:
+                    return {"ok": False, "error": str(e)}
+                return {"ok": True, "messages": messages}
+        
+        unique = list(dict.fromkeys(thread_ts_list))
+        results = await asyncio.gather(*(fetch(thread_ts) for thread_ts in unique))
+        return dict(zip(unique, results))
     
     async def get_users(self, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get a list of all users in the workspace"""
+        params = self._users_params(limit, cursor)
+        return await self._cached(("users.list", params["limit"], cursor), "users.list", params)
+    
+    def _users_params(self, limit: int, cursor: Optional[str] = None) -> Dict[str, str]:
         params = {
             "limit": str(min(limit, 200)),
-            "team_id": team_id
+            "team_id": self.team_id
         }
         
         if cursor:
             params["cursor"] = cursor
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://slack.com/api/users.list",
-                headers=self.bot_headers,
-                params=params
-            )
-            return response.json()
+        return params
+    
+    async def _iter_pages(self, fetch, key: str) -> AsyncIterator[Dict[str, Any]]:
+        """Follow response_metadata.next_cursor, yielding each record under key"""
+        cursor = None
+        while True:
+            response = await fetch(200, cursor)
+            if not response.get("ok"):
+                raise SlackAPIError(response.get("error", "unknown_error"))
+            for record in response.get(key, []):
+                yield record
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return
+    
+    async def iter_channels(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every public channel, fetching pages of 200 as needed"""
+        if self.stream:
+            pages = self._iter_stream("conversations.list", self._channels_params(200), "channels")
+        else:
+            pages = self._iter_pages(self.get_channels, "channels")
+        async for channel in pages:
+            yield channel
+    
+    async def iter_users(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every user in the workspace, fetching pages of 200 as needed"""
+        # Cached pages are worth more than streaming a fresh copy
+        if self.stream and self.cache is None:
+            pages = self._iter_stream("users.list", self._users_params(200), "members")
+        else:
+            pages = self._iter_pages(self.get_users, "members")
+        async for user in pages:
+            yield user
     
     async def get_user_profile(self, user_id: str) -> Dict[str, Any]:
         """Get detailed profile information for a specific user"""
@@ -142,75 +985,124 @@ class SlackClient:
             "include_labels": "true"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://slack.com/api/users.profile.get",
-                headers=self.bot_headers,
-                params=params
-            )
-            return response.json()
+        return await self._cached(("users.profile.get", user_id), "users.profile.get", params)
 
-# Initialize Slack client
-slack_client = SlackClient(bot_token)
+# Populated by create_app
+settings: Optional[Settings] = None
+slack_client: Optional[SlackClient] = None
 
-@mcp.tool()
-async def slack_list_channels(limit: int = 100, cursor: Optional[str] = None) -> str:
+# Tool functions, registered on the FastMCP server by create_app
+TOOLS: List[Callable[..., Any]] = []
+
+# A tool result that reports a failure: the tool's own {"error": ...} or a
+# Slack {"ok": false, ...} envelope, whose first key is always ok
+FAILED_RESULT = re.compile(r'\{\s*(?:"error"\s*:|"ok"\s*:\s*false\b)')
+
+def tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark an async function as an MCP tool, timing every call in the metrics"""
+    name = fn.__name__
+    
+    @functools.wraps(fn)
+    async def timed(*args: Any, **kwargs: Any) -> str:
+        metrics.TOOL_IN_FLIGHT.inc(name)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            with tracer.span(f"tool {name}", **{"mcp.tool.name": name}) as span:
+                result = await fn(*args, **kwargs)
+                # Tools report failures in the result rather than raising
+                if not FAILED_RESULT.match(result):
+                    outcome = "ok"
+                span.set("mcp.tool.outcome", outcome)
+            return result
+        finally:
+            metrics.TOOL_SECONDS.observe(time.perf_counter() - start, name)
+            metrics.TOOL_CALLS.inc(name, outcome)
+            metrics.TOOL_IN_FLIGHT.dec(name)
+    
+    TOOLS.append(timed)
+    return timed
+
+@tool
+async def slack_list_channels(limit: int = 100, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> str:
     """List public channels in the workspace with pagination
     
     Args:
         limit: Maximum number of channels to return (default 100, max 200)
         cursor: Pagination cursor for next page of results
+        fields: Optional channel fields to keep, e.g. ["id", "name", "topic.value"]; ["*"] for all
     """
     try:
         response = await slack_client.get_channels(limit, cursor)
-        return json.dumps(response)
+        return dumps(project_response(response, "channels", tool_fields("slack_list_channels", fields)))
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_post_message(channel_id: str, text: str) -> str:
+@tool
+async def slack_post_message(
+    channel_id: str,
+    text: str,
+    idempotency_key: Optional[str] = None,
+    queued: bool = False
+) -> str:
     """Post a new message to a Slack channel
     
     Args:
-        channel_id: The ID of the channel to post to
+        channel_id: The ID of the channel to post to, or its name as #channel-name
         text: The message text to post
+        idempotency_key: Optional unique key for this post; retrying with the same key returns the original message instead of posting again
+        queued: Return immediately with an outbox id instead of waiting for delivery; check it with slack_outbox_status
     """
     try:
         if not channel_id or not text:
             raise ValueError("Missing required arguments: channel_id and text")
         
-        response = await slack_client.post_message(channel_id, text)
-        return json.dumps(response)
+        channel_id = await slack_client.names.resolve_channel(channel_id)
+        if queued:
+            return dumps(slack_client.queue_message(channel_id, text, idempotency_key=idempotency_key))
+        response = await slack_client.post_message(channel_id, text, idempotency_key)
+        return dumps(response)
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_reply_to_thread(channel_id: str, thread_ts: str, text: str) -> str:
+@tool
+async def slack_reply_to_thread(
+    channel_id: str,
+    thread_ts: str,
+    text: str,
+    idempotency_key: Optional[str] = None,
+    queued: bool = False
+) -> str:
     """Reply to a specific message thread in Slack
     
     Args:
-        channel_id: The ID of the channel containing the thread
+        channel_id: The ID of the channel containing the thread, or its name as #channel-name
         thread_ts: The timestamp of the parent message in the format '1234567890.123456'
         text: The reply text
+        idempotency_key: Optional unique key for this reply; retrying with the same key returns the original reply instead of posting again
+        queued: Return immediately with an outbox id instead of waiting for delivery; check it with slack_outbox_status
     """
     try:
         if not channel_id or not thread_ts or not text:
             raise ValueError("Missing required arguments: channel_id, thread_ts, and text")
         
-        response = await slack_client.post_reply(channel_id, thread_ts, text)
-        return json.dumps(response)
+        channel_id = await slack_client.names.resolve_channel(channel_id)
+        if queued:
+            return dumps(slack_client.queue_message(channel_id, text, thread_ts, idempotency_key))
+        response = await slack_client.post_reply(channel_id, thread_ts, text, idempotency_key)
+        return dumps(response)
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
+@tool
 async def slack_add_reaction(channel_id: str, timestamp: str, reaction: str) -> str:
     """Add a reaction emoji to a message
     
     Args:
-        channel_id: The ID of the channel containing the message
+        channel_id: The ID of the channel containing the message, or its name as #channel-name
         timestamp: The timestamp of the message to react to
         reaction: The name of the emoji reaction (without ::)
     """
@@ -218,84 +1110,737 @@ async def slack_add_reaction(channel_id: str, timestamp: str, reaction: str) ->
         if not channel_id or not timestamp or not reaction:
             raise ValueError("Missing required arguments: channel_id, timestamp, and reaction")
         
+        channel_id = await slack_client.names.resolve_channel(channel_id)
         response = await slack_client.add_reaction(channel_id, timestamp, reaction)
-        return json.dumps(response)
+        return dumps(response)
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_get_channel_history(channel_id: str, limit: int = 10) -> str:
-    """Get recent messages from a channel
+@tool
+async def slack_add_reactions_batch(reactions: List[Dict[str, str]]) -> str:
+    """Add many reaction emojis in one call, e.g. to acknowledge a set of alerts
     
     Args:
-        channel_id: The ID of the channel
+        reactions: Items with channel_id (ID or #channel-name), timestamp and reaction (without ::), e.g. [{"channel_id": "#alerts", "timestamp": "1234567890.123456", "reaction": "eyes"}]
+    """
+    try:
+        if not reactions:
+            raise ValueError("Missing required argument: reactions")
+        
+        results = await slack_client.add_reactions(reactions, settings.batch_concurrency)
+        succeeded = sum(1 for result in results if result["ok"])
+        return dumps({"ok": succeeded == len(results), "succeeded": succeeded, "results": results})
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_get_channel_history(
+    channel_id: str,
+    limit: int = 10,
+    oldest: Optional[str] = None,
+    latest: Optional[str] = None,
+    inclusive: bool = False,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    user_ids: Optional[List[str]] = None,
+    bots: Optional[bool] = None,
+    subtypes: Optional[List[str]] = None,
+    exclude_subtypes: Optional[List[str]] = None,
+    has_thread: Optional[bool] = None,
+    has_reactions: Optional[bool] = None,
+    text_pattern: Optional[str] = None,
+    max_scan: int = 1000
+) -> str:
+    """Get recent messages from a channel, optionally filtered on the server
+    
+    With any filter set, history is paged until limit messages match or
+    max_scan messages were scanned; the result reports how many were scanned.
+    
+    Args:
+        channel_id: The ID of the channel, or its name as #channel-name
         limit: Number of messages to retrieve (default 10)
+        oldest: Only messages after this Unix timestamp, e.g. '1234567890.123456'
+        latest: Only messages before this Unix timestamp
+        inclusive: Include messages exactly at oldest/latest
+        cursor: Pagination cursor for next page of results
+        fields: Optional message fields to keep, e.g. ["ts", "user", "text"]; ["*"] for all
+        user_ids: Only messages from these users, as IDs or handles as @handle
+        bots: true for only bot messages, false to drop bot messages
+        subtypes: Only these subtypes, e.g. ["bot_message"]; "message" stands for ordinary messages
+        exclude_subtypes: Drop these subtypes, e.g. ["channel_join", "channel_leave"]
+        has_thread: true for only thread parents with replies, false to drop them
+        has_reactions: true for only messages with reactions, false to drop them
+        text_pattern: Case-insensitive regular expression the message text must contain
+        max_scan: Most messages to scan when filtering (default 1000)
     """
     try:
         if not channel_id:
             raise ValueError("Missing required argument: channel_id")
         
-        response = await slack_client.get_channel_history(channel_id, limit)
-        return json.dumps(response)
+        if user_ids:
+            user_ids = [await slack_client.names.resolve_user(user) for user in user_ids]
+        message_filter = MessageFilter.from_args(
+            user_ids, bots, subtypes, exclude_subtypes, has_thread, has_reactions, text_pattern
+        )
+        channel_id = await slack_client.names.resolve_channel(channel_id)
+        if message_filter.active:
+            response = await slack_client.get_filtered_history(
+                channel_id, message_filter, limit, oldest, latest, inclusive, cursor, max_scan
+            )
+        else:
+            response = await slack_client.get_channel_history(channel_id, limit, oldest, latest, inclusive, cursor)
+        return dumps(project_response(response, "messages", tool_fields("slack_get_channel_history", fields)))
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_get_thread_replies(channel_id: str, thread_ts: str) -> str:
+@tool
+async def slack_get_channel_history_range(
+    channel_id: str,
+    oldest: Optional[str] = None,
+    latest: Optional[str] = None,
+    inclusive: bool = False,
+    max_messages: int = 1000,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """Get all messages in a time window of a channel in one call, paging internally
+    
+    Args:
+        channel_id: The ID of the channel, or its name as #channel-name
+        oldest: Start of the window as a Unix timestamp, e.g. '1234567890.123456'
+        latest: End of the window as a Unix timestamp (default now)
+        inclusive: Include messages exactly at oldest/latest
+        max_messages: Maximum number of messages to return (default 1000)
+        cursor: next_cursor from a previous call to continue the same window
+        fields: Optional message fields to keep, e.g. ["ts", "user", "text"]; ["*"] for all
+    """
+    try:
+        if not channel_id:
+            raise ValueError("Missing required argument: channel_id")
+        
+        channel_id = await slack_client.names.resolve_channel(channel_id)
+        # Projected as messages are decoded, not after the whole window is in memory
+        project = record_projector(tool_fields("slack_get_channel_history_range", fields))
+        response = await slack_client.get_channel_history_range(
+            channel_id, oldest, latest, inclusive, max_messages, cursor, transform=project
+        )
+        return dumps(response)
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_get_thread_replies(channel_id: str, thread_ts: str, fields: Optional[List[str]] = None) -> str:
     """Get all replies in a message thread
     
     Args:
-        channel_id: The ID of the channel containing the thread
+        channel_id: The ID of the channel containing the thread, or its name as #channel-name
         thread_ts: The timestamp of the parent message
+        fields: Optional message fields to keep, e.g. ["ts", "user", "text"]; ["*"] for all
     """
     try:
         if not channel_id or not thread_ts:
             raise ValueError("Missing required arguments: channel_id and thread_ts")
         
+        channel_id = await slack_client.names.resolve_channel(channel_id)
         response = await slack_client.get_thread_replies(channel_id, thread_ts)
-        return json.dumps(response)
+        return dumps(project_response(response, "messages", tool_fields("slack_get_thread_replies", fields)))
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_get_threads_batch(
+    channel_id: str,
+    thread_ts_list: List[str],
+    fields: Optional[List[str]] = None
+) -> str:
+    """Get all replies for many threads in a channel in one call, keyed by thread_ts
+    
+    Args:
+        channel_id: The ID of the channel containing the threads, or its name as #channel-name
+        thread_ts_list: Timestamps of the parent messages
+        fields: Optional message fields to keep, e.g. ["ts", "user", "text"]; ["*"] for all
+    """
+    try:
+        if not channel_id or not thread_ts_list:
+            raise ValueError("Missing required arguments: channel_id and thread_ts_list")
+        
+        channel_id = await slack_client.names.resolve_channel(channel_id)
+        threads = await slack_client.get_threads(channel_id, thread_ts_list, settings.batch_concurrency)
+        fields = tool_fields("slack_get_threads_batch", fields)
+        threads = {ts: project_response(thread, "messages", fields) for ts, thread in threads.items()}
+        return dumps({"ok": True, "threads": threads})
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_get_users(limit: int = 100, cursor: Optional[str] = None) -> str:
+@tool
+async def slack_get_users(limit: int = 100, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> str:
     """Get a list of all users in the workspace with their basic profile information
     
     Args:
         limit: Maximum number of users to return (default 100, max 200)
         cursor: Pagination cursor for next page of results
+        fields: Optional user fields to keep, e.g. ["id", "name", "profile.real_name"]; ["*"] for all
     """
     try:
         response = await slack_client.get_users(limit, cursor)
-        return json.dumps(response)
+        return dumps(project_response(response, "members", tool_fields("slack_get_users", fields)))
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-@mcp.tool()
-async def slack_get_user_profile(user_id: str) -> str:
+@tool
+async def slack_get_user_profile(user_id: str, fields: Optional[List[str]] = None) -> str:
     """Get detailed profile information for a specific user
     
     Args:
-        user_id: The ID of the user
+        user_id: The ID of the user, or their handle as @handle
+        fields: Optional profile fields to keep, e.g. ["real_name", "title"]; ["*"] for all
     """
     try:
         if not user_id:
             raise ValueError("Missing required argument: user_id")
         
+        user_id = await slack_client.names.resolve_user(user_id)
         response = await slack_client.get_user_profile(user_id)
-        return json.dumps(response)
+        return dumps(project_response(response, "profile", tool_fields("slack_get_user_profile", fields)))
     except Exception as e:
         error_response = {"error": str(e)}
-        return json.dumps(error_response)
+        return dumps(error_response)
 
-if __name__ == "__main__":
+@tool
+async def slack_list_all_channels(fields: Optional[List[str]] = None) -> str:
+    """List every public channel in the workspace, following pagination internally
+    
+    Args:
+        fields: Optional channel fields to keep, e.g. ["id", "name", "topic.value"]; ["*"] for all
+    """
+    try:
+        project = record_projector(tool_fields("slack_list_all_channels", fields))
+        channels = [project(channel) async for channel in slack_client.iter_channels()]
+        return dumps({"ok": True, "count": len(channels), "channels": channels})
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_list_all_users(fields: Optional[List[str]] = None) -> str:
+    """List every user in the workspace, following pagination internally
+    
+    Args:
+        fields: Optional user fields to keep, e.g. ["id", "name", "profile.real_name"]; ["*"] for all
+    """
     try:
-        # Run the server with stdio transport
-        mcp.run(transport='stdio')
+        project = record_projector(tool_fields("slack_list_all_users", fields))
+        users = [project(user) async for user in slack_client.iter_users()]
+        return dumps({"ok": True, "count": len(users), "members": users})
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_rate_limit_status() -> str:
+    """Show client-side rate limiting: queued calls, wait times and 429s per Slack method"""
+    try:
+        if slack_client.rate_limiter is None:
+            raise ValueError("Rate limiting is disabled (SLACK_RATE_LIMIT=false)")
+        
+        stats = slack_client.rate_limiter.stats()
+        if asyncio.iscoroutine(stats):
+            # Worker mode: the shared state lives in the coordinator process
+            stats = await stats
+        return dumps(stats)
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_cache_status() -> str:
+    """Show user profile/directory cache size, hit ratio and evictions"""
+    try:
+        if slack_client.cache is None:
+            raise ValueError("Caching is disabled (SLACK_CACHE=false)")
+        
+        stats = slack_client.cache.stats()
+        if asyncio.iscoroutine(stats):
+            # Worker mode: the shared state lives in the coordinator process
+            stats = await stats
+        return dumps(stats)
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_outbox_status(message_ids: Optional[List[str]] = None) -> str:
+    """Show delivery state of queued posts, or outbox totals when no ids are given
+    
+    Args:
+        message_ids: Outbox ids returned by queued posts, e.g. ["out-1", "out-2"]
+    """
+    try:
+        if not message_ids:
+            return dumps(slack_client.outbox.stats())
+        
+        messages = {message_id: slack_client.outbox.status(message_id) for message_id in message_ids}
+        return dumps({"ok": True, "messages": messages})
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_retry_status() -> str:
+    """Show how many Slack calls were retried after transient failures, per method"""
+    try:
+        if slack_client.retry is None:
+            raise ValueError("Retries are disabled (SLACK_RETRY_ATTEMPTS=0)")
+        
+        return dumps(slack_client.retry.stats())
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_coalesce_status() -> str:
+    """Show how many read calls shared an identical in-flight Slack request"""
+    try:
+        return dumps(slack_client.coalesce_stats())
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+@tool
+async def slack_server_stats() -> str:
+    """Show server diagnostics: Slack call latency and errors per method, tool timings, cache, retries and queues"""
+    try:
+        async def resolve(stats: Any) -> Any:
+            # Worker mode: shared state lives in the coordinator process
+            return await stats if asyncio.iscoroutine(stats) else stats
+        
+        slack_api: Dict[str, Dict[str, Any]] = {}
+        for (method,) in metrics.SLACK_REQUEST_SECONDS.counts:
+            slack_api[method] = {
+                **metrics.SLACK_REQUEST_SECONDS.summary((method,)),
+                "in_flight": metrics.SLACK_IN_FLIGHT.values.get((method,), 0),
+                "bytes_sent": metrics.SLACK_BYTES_SENT.values.get((method,), 0),
+                "bytes_received": metrics.SLACK_BYTES_RECEIVED.values.get((method,), 0),
+                "status": {status: count for (m, status), count in metrics.SLACK_REQUESTS.values.items() if m == method},
+                "errors": {error: count for (m, error), count in metrics.SLACK_ERRORS.values.items() if m == method},
+            }
+        tools = {
+            name: {
+                **metrics.TOOL_SECONDS.summary((name,)),
+                "errors": metrics.TOOL_CALLS.values.get((name, "error"), 0),
+            }
+            for (name,) in metrics.TOOL_SECONDS.counts
+        }
+        
+        stats = {
+            "uptime_seconds": round(time.monotonic() - started_at, 1),
+            "active_sessions": active_sessions,
+            "http2": slack_client.http2,
+            "slack_api": slack_api,
+            "tools": tools,
+            "cache": await resolve(slack_client.cache.stats()) if slack_client.cache is not None else None,
+            "rate_limit": await resolve(slack_client.rate_limiter.stats()) if slack_client.rate_limiter is not None else None,
+            "retry": slack_client.retry.stats() if slack_client.retry is not None else None,
+            "coalescing": slack_client.coalesce_stats(),
+            "outbox": slack_client.outbox.stats(),
+            "idempotency": slack_client.idempotency.stats(),
+        }
+        return dumps(stats)
+    except Exception as e:
+        error_response = {"error": str(e)}
+        return dumps(error_response)
+
+def collect_client_metrics() -> None:
+    """Refresh the component gauges from slack_client before a scrape"""
+    if slack_client is None:
+        return
+    cache = slack_client.cache
+    if isinstance(cache, TTLCache):
+        cache_stats = cache.stats()
+        metrics.CACHE_ENTRIES.set(cache_stats["entries"])
+        metrics.CACHE_BYTES.set(cache_stats["bytes"])
+        metrics.CACHE_HIT_RATIO.set(cache_stats["hit_ratio"])
+    if isinstance(slack_client.rate_limiter, RateLimiter):
+        rate_stats = slack_client.rate_limiter.stats()
+        metrics.RATE_LIMIT_QUEUED.set(rate_stats["queued"])
+        metrics.RATE_LIMIT_THROTTLED.set(rate_stats["throttled"])
+    if slack_client.retry is not None:
+        for method, count in slack_client.retry.retried.items():
+            metrics.RETRIES.set(count, method)
+    metrics.COALESCED_READS.set(slack_client.coalesce_stats()["coalesced"])
+    metrics.OUTBOX_QUEUED.values.clear()
+    for channel, queued in slack_client.outbox.stats()["queued"].items():
+        metrics.OUTBOX_QUEUED.set(queued, channel)
+
+metrics.REGISTRY.collectors.append(collect_client_metrics)
+
+def create_slack_client(settings: Settings, transport: Optional["httpx.AsyncBaseTransport"] = None) -> SlackClient:
+    """Build the SlackClient described by settings, optionally over a custom httpx transport"""
+    import httpx
+    
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive,
+        keepalive_expiry=settings.http_keepalive_expiry
+    )
+    if settings.cassette_replay:
+        from pageless.cassette import ReplayTransport
+        
+        transport = ReplayTransport(settings.cassette_replay, settings.cassette_speed)
+    elif settings.cassette_record:
+        from pageless.cassette import RecordingTransport
+        
+        if transport is None:
+            # The client ignores its own pool settings once given a transport
+            http2 = settings.http2 and importlib.util.find_spec("h2") is not None
+            transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        transport = RecordingTransport(transport, settings.cassette_record)
+    
+    return SlackClient(
+        settings.bot_token,
+        team_id=settings.team_id,
+        base_url=settings.api_url,
+        transport=transport,
+        limits=limits,
+        http2=settings.http2,
+        timeout=settings.http_timeout,
+        rate_limiter=RateLimiter(settings.rate_limit_scale) if settings.rate_limit else None,
+        rate_limit_retries=settings.rate_limit_retries,
+        retry=RetryPolicy(settings.retry_attempts, settings.retry_base_delay, settings.retry_max_delay)
+        if settings.retry_attempts > 0 else None,
+        coalesce=settings.coalesce,
+        stream=settings.stream_decode,
+        cache=TTLCache(settings.cache_ttl, settings.cache_max_entries, settings.cache_max_bytes) if settings.cache else None,
+        store=MessageStore(settings.store_path) if settings.store_path else None,
+        store_lookback=settings.store_lookback,
+        store_reconcile_interval=settings.store_reconcile_interval,
+        store_catchup_pages=settings.store_catchup_pages,
+        idempotency=IdempotencyStore(
+            settings.idempotency_ttl, settings.idempotency_max_entries, settings.idempotency_path
+        ),
+        outbox_coalesce=settings.outbox_coalesce,
+        name_index_refresh=settings.name_index_refresh
+    )
+
+# Seconds open SSE streams get to finish once the server is asked to stop
+SSE_SHUTDOWN_TIMEOUT = 5.0
+# Seconds run_workers waits for all workers to exit before killing them
+WORKER_STOP_TIMEOUT = SSE_SHUTDOWN_TIMEOUT + CLOSE_TIMEOUT + 2
+
+# Number of MCP sessions currently inside slack_lifespan
+active_sessions = 0
+started_at = time.monotonic()
+# The /metrics listener, open from serve (or the first in-process session)
+# until shutdown
+metrics_server: Optional[asyncio.AbstractServer] = None
+
+async def start_metrics() -> None:
+    """Open the /metrics listener if SLACK_METRICS_PORT is set and it is not open yet"""
+    global metrics_server
+    if settings.metrics_port is not None and metrics_server is None:
+        metrics_server = await metrics.serve_metrics(settings.metrics_host, settings.metrics_port)
+
+@asynccontextmanager
+async def slack_lifespan(server: "FastMCP") -> AsyncIterator[None]:
+    """Count sessions and open the shared Slack client and metrics server on first use
+    
+    Over stdio there is exactly one session. Over SSE every client connection
+    enters the lifespan, and they all share one pool, cache and rate limiter.
+    Nothing is closed when a session ends: the process stays up between SSE
+    clients and queued posts must still go out. serve (or shutdown, for
+    embedders) closes it all on exit.
+    """
+    global active_sessions
+    active_sessions += 1
+    await slack_client.start()
+    # Already open when run through serve; embedders get it on first use
+    await start_metrics()
+    try:
+        yield
+    finally:
+        active_sessions -= 1
+
+async def shutdown() -> None:
+    """Deliver queued posts, then close the Slack client and the metrics server
+    
+    serve calls this on exit. Code that runs the app from create_app itself
+    (in-process sessions, benchmarks) calls it when done; until then
+    recorded cassettes are not finalized and queued posts may not go out.
+    """
+    global metrics_server
+    await slack_client.aclose()
+    if metrics_server is not None:
+        server, metrics_server = metrics_server, None
+        server.close()
+        await server.wait_closed()
+
+async def run_sse(mcp: "FastMCP", shutdown_timeout: float = SSE_SHUTDOWN_TIMEOUT) -> None:
+    """Serve mcp over SSE until SIGINT or SIGTERM
+    
+    Same app as FastMCP.run_sse_async, but open SSE streams get at most
+    shutdown_timeout seconds once a signal arrives (uvicorn would wait on
+    them forever) and the signal is not re-raised when the server stops, so
+    the caller can still close the client.
+    """
+    import contextlib
+    import threading
+    import uvicorn
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.routing import Mount, Route
+    
+    sse = SseServerTransport("/messages/")
+    
+    async def handle_sse(request: Any) -> None:
+        async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
+            await mcp._mcp_server.run(streams[0], streams[1], mcp._mcp_server.create_initialization_options())
+    
+    app = Starlette(
+        debug=mcp.settings.debug,
+        routes=[
+            Route("/sse", endpoint=handle_sse),
+            Mount("/messages/", app=sse.handle_post_message),
+        ]
+    )
+    
+    class Server(uvicorn.Server):
+        @contextlib.contextmanager
+        def capture_signals(self) -> Any:
+            if threading.current_thread() is not threading.main_thread():
+                yield
+                return
+            import signal
+            
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, self.handle_exit, signum, None)
+            try:
+                yield
+            finally:
+                for signum in (signal.SIGINT, signal.SIGTERM):
+                    loop.remove_signal_handler(signum)
+    
+    config = uvicorn.Config(
+        app,
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower(),
+        timeout_graceful_shutdown=shutdown_timeout
+    )
+    await Server(config).serve()
+
+async def serve(mcp: "FastMCP", transport: str) -> None:
+    """Run the MCP server until it stops, then deliver queued posts and close everything"""
+    # Scrapable before the first client connects
+    await start_metrics()
+    try:
+        if transport == "sse":
+            await run_sse(mcp)
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        await shutdown()
+
+def create_app(
+    app_settings: Optional[Settings] = None,
+    http_transport: Optional["httpx.AsyncBaseTransport"] = None,
+    **server_settings: Any
+) -> "FastMCP":
+    """Build the Slack client and the FastMCP server with every tool registered
+    
+    http_transport replaces the network for Slack calls, e.g. with a replay
+    or mock transport. server_settings are passed through to FastMCP, e.g.
+    host and port for SSE.
+    """
+    global settings, slack_client, serializer, tracer
+    from mcp.server.fastmcp import FastMCP
+    
+    settings = app_settings or Settings.from_env()
+    serializer = JSONSerializer(settings.json_backend)
+    tracer = Tracer(FileExporter(settings.trace_file)) if settings.trace_file else Tracer()
+    slack_client = create_slack_client(settings, http_transport)
+    
+    # FastMCP binds every interface by default; the tools are unauthenticated
+    server_settings.setdefault("host", "127.0.0.1")
+    mcp = FastMCP("Slack MCP Server", lifespan=slack_lifespan, **server_settings)
+    for fn in TOOLS:
+        mcp.add_tool(fn)
+    keep_string_arguments(mcp)
+    return mcp
+
+def keep_string_arguments(mcp: "FastMCP") -> None:
+    """Stop FastMCP from JSON-decoding arguments of string parameters
+    
+    mcp 1.4's FuncMetadata.pre_parse_json JSON-decodes every string argument,
+    so a Slack timestamp such as "1700000000.000100" arrives as a float and
+    message text such as '[1, 2, 3]' as a list, and both then fail
+    validation as str. Parameters annotated str or Optional[str] are passed
+    through exactly as sent; for the rest only lists and objects sent as
+    JSON strings are decoded.
+    """
+    from typing import Union, get_args, get_origin
+    from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata
+    
+    def is_string(annotation: Any) -> bool:
+        if get_origin(annotation) is Union:
+            return all(arg in (str, type(None)) for arg in get_args(annotation))
+        return annotation is str
+    
+    class StringArgumentsMetadata(FuncMetadata):
+        def pre_parse_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
+            fields = self.arg_model.model_fields
+            decodable = {
+                name: value for name, value in data.items()
+                if name not in fields or not is_string(fields[name].annotation)
+            }
+            parsed = super().pre_parse_json(decodable)
+            return {
+                name: parsed[name] if name in parsed and isinstance(parsed[name], (list, dict)) else value
+                for name, value in data.items()
+            }
+    
+    for registered in mcp._tool_manager.list_tools():
+        registered.fn_metadata = StringArgumentsMetadata(arg_model=registered.fn_metadata.arg_model)
+
+def run_worker(app_settings: Settings, coordinator_path: str, host: str, port: int) -> None:
+    """Worker process: serve SSE with rate limiting and caching delegated to the coordinator"""
+    mcp = create_app(app_settings, host=host, port=port)
+    coordinator = CoordinatorClient(coordinator_path)
+    if slack_client.rate_limiter is not None:
+        slack_client.rate_limiter = SharedRateLimiter(coordinator)
+    if slack_client.cache is not None:
+        slack_client.cache = SharedCache(
+            coordinator,
+            encode=dumps,
+            decode=lambda text: SlackResponse(serializer.loads(text), text.encode())
+        )
+    asyncio.run(serve(mcp, "sse"))
+
+def run_workers(app_settings: Settings, workers: int, host: str, port: int) -> None:
+    """Serve SSE from several worker processes sharing one Slack budget and cache
+    
+    Worker i listens on port + i. An SSE session posts its messages back to
+    the port it connected to, so each client stays on one worker. The parent
+    process runs the coordinator that owns the rate limiter and cache.
+    """
+    import multiprocessing
+    import signal
+    import tempfile
+    
+    path = os.path.join(tempfile.mkdtemp(prefix="pageless-"), "coordinator.sock")
+    coordinator = Coordinator(
+        path,
+        RateLimiter(app_settings.rate_limit_scale) if app_settings.rate_limit else None,
+        TTLCache(app_settings.cache_ttl, app_settings.cache_max_entries, app_settings.cache_max_bytes)
+        if app_settings.cache else None
+    )
+    
+    async def serve() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        
+        await coordinator.start()
+        context = multiprocessing.get_context("spawn")
+        # Each worker serves its own metrics, on consecutive ports as well
+        processes = [
+            context.Process(target=run_worker, args=(
+                replace(app_settings, metrics_port=app_settings.metrics_port + i)
+                if app_settings.metrics_port is not None else app_settings,
+                path, host, port + i
+            ))
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        print(f"Workers listening on {host}:{port}-{port + workers - 1}", file=sys.stderr)
+        try:
+            # Run until stopped; if any worker dies, shut the rest down so a
+            # process supervisor sees the failure and restarts the server
+            while not stop.is_set() and all(process.is_alive() for process in processes):
+                try:
+                    await asyncio.wait_for(stop.wait(), 1.0)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            # Workers stop together, each closing its SSE streams and then
+            # flushing its outbox; whatever is still running at the deadline
+            # is killed
+            await asyncio.gather(*(asyncio.to_thread(process.join, WORKER_STOP_TIMEOUT) for process in processes))
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+            await coordinator.close()
+            os.unlink(path)
+    
+    asyncio.run(serve())
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pageless", description="Slack MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse"],
+        default=os.environ.get("SLACK_MCP_TRANSPORT", "stdio"),
+        help="stdio serves a single client; sse serves many clients from one process"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to bind for the sse transport (default 127.0.0.1); the server has no authentication "
+        "and posts as the bot, so only bind a public address such as 0.0.0.0 behind access control"
+    )
+    parser.add_argument("--port", type=int, help="Port for the sse transport (default 8000)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("SLACK_MCP_WORKERS", "1")),
+        help="Worker processes for the sse transport, on consecutive ports sharing one rate limit budget"
+    )
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Console entry point: validate the environment and run the server"""
+    args = parse_args(argv)
+    try:
+        app_settings = Settings.from_env()
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    
+    if args.workers > 1:
+        if args.transport != "sse":
+            print("--workers requires --transport sse", file=sys.stderr)
+            sys.exit(1)
+        print(f"Starting Slack MCP Server (sse, {args.workers} workers)...", file=sys.stderr)
+        run_workers(app_settings, args.workers, args.host, args.port or 8000)
+        return
+    
+    server_settings = {"host": args.host}
+    if args.port is not None:
+        server_settings["port"] = args.port
+    
+    if app_settings.http2 and importlib.util.find_spec("h2") is None:
+        print("SLACK_HTTP2 is on but h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1",
+              file=sys.stderr)
+    print(f"Starting Slack MCP Server ({args.transport})...", file=sys.stderr)
+    mcp = create_app(app_settings, **server_settings)
+    
+    try:
+        asyncio.run(serve(mcp, args.transport))
     except Exception as e:
         print(f"Fatal error: {e}", file=sys.stderr)
         sys.exit(1)
+
+if __name__ == "__main__":
+    main()
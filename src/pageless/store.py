@@ -0,0 +1,124 @@
+"""SQLite-backed local copy of channel history.
+
+``MessageStore`` keeps the messages already read from each channel together
+with a watermark (the newest ``ts`` seen), the oldest ``ts`` held and
+whether the store reaches back to the start of the channel. ``SlackClient``
+uses this to fetch only what is new since the last read and serve the rest
+from disk, re-reading a recent window now and then to pick up edits and
+deletes.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    channel TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (channel, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS channels (
+    channel TEXT PRIMARY KEY,
+    newest_ts TEXT NOT NULL,
+    oldest_ts TEXT NOT NULL,
+    complete INTEGER NOT NULL,
+    reconciled_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass
+class ChannelState:
+    newest_ts: str
+    oldest_ts: str
+    # True once the store holds everything back to the first message
+    complete: bool
+    # When the look-back window was last re-read for edits and deletes
+    reconciled_at: float = 0.0
+
+
+class MessageStore:
+    """Per-channel message cache on disk; blocking work runs in a thread"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(channels)")]
+        if "reconciled_at" not in columns:
+            # Stores created before reconciled_at was tracked
+            self._db.execute("ALTER TABLE channels ADD COLUMN reconciled_at REAL NOT NULL DEFAULT 0")
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    async def _run(self, fn, *args) -> Any:
+        def locked() -> Any:
+            with self._lock, self._db:
+                return fn(*args)
+        return await asyncio.to_thread(locked)
+
+    async def state(self, channel: str) -> Optional[ChannelState]:
+        def query() -> Optional[ChannelState]:
+            row = self._db.execute(
+                "SELECT newest_ts, oldest_ts, complete, reconciled_at FROM channels WHERE channel = ?", (channel,)
+            ).fetchone()
+            return ChannelState(row[0], row[1], bool(row[2]), row[3]) if row else None
+        return await self._run(query)
+
+    async def set_state(self, channel: str, state: ChannelState) -> None:
+        await self._run(
+            self._db.execute,
+            "INSERT OR REPLACE INTO channels (channel, newest_ts, oldest_ts, complete, reconciled_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (channel, state.newest_ts, state.oldest_ts, int(state.complete), state.reconciled_at)
+        )
+
+    async def upsert(self, channel: str, messages: List[Dict[str, Any]]) -> None:
+        await self._run(
+            self._db.executemany,
+            "INSERT OR REPLACE INTO messages (channel, ts, data) VALUES (?, ?, ?)",
+            [(channel, m["ts"], json.dumps(m)) for m in messages if "ts" in m]
+        )
+
+    async def sync_window(self, channel: str, since: str, messages: List[Dict[str, Any]]) -> None:
+        """Make the stored messages newer than ``since`` match ``messages`` exactly
+
+        Upserts catch edits; stored messages missing from ``messages`` were
+        deleted on Slack and are dropped.
+        """
+        def sync() -> None:
+            self._db.execute("DELETE FROM messages WHERE channel = ? AND ts > ?", (channel, since))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO messages (channel, ts, data) VALUES (?, ?, ?)",
+                [(channel, m["ts"], json.dumps(m)) for m in messages if "ts" in m]
+            )
+        await self._run(sync)
+
+    async def reset(self, channel: str) -> None:
+        """Forget a channel's messages and state; the next read starts from scratch"""
+        def reset() -> None:
+            self._db.execute("DELETE FROM messages WHERE channel = ?", (channel,))
+            self._db.execute("DELETE FROM channels WHERE channel = ?", (channel,))
+        await self._run(reset)
+
+    async def count(self, channel: str) -> int:
+        def query() -> int:
+            return self._db.execute("SELECT COUNT(*) FROM messages WHERE channel = ?", (channel,)).fetchone()[0]
+        return await self._run(query)
+
+    async def recent(self, channel: str, limit: int) -> List[Dict[str, Any]]:
+        """Newest ``limit`` stored messages, newest first like conversations.history"""
+        def query() -> List[Dict[str, Any]]:
+            rows = self._db.execute(
+                "SELECT data FROM messages WHERE channel = ? ORDER BY ts DESC LIMIT ?", (channel, limit)
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        return await self._run(query)
@@ -0,0 +1,160 @@
+"""Optional per-call tracing with OpenTelemetry-compatible spans.
+
+Spans cover each tool invocation, each Slack HTTP attempt and its phases
+(connect, TLS, sending the request, waiting for and reading the response),
+JSON decode and result serialization. Finished spans are written as JSON
+lines using the OTLP/JSON span field names, so a file can be replayed into a
+collector or inspected directly. With no exporter every call is a no-op on a
+shared null span.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, IO, Optional
+
+_current: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("pageless_span", default=None)
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation; use as a context manager or call ``end()``"""
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start_ns", "attributes", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.time_ns()
+        self.attributes = attributes
+        self._token = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        self.tracer.export(self, time.time_ns(), error)
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._token)
+        self.end(exc)
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is off"""
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class FileExporter:
+    """Appends finished spans to a file, one OTLP/JSON span per line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: IO[str] = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, record: Dict[str, Any], flush: bool) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            if flush:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Creates spans under the current one; disabled when there is no exporter"""
+
+    def __init__(self, exporter: Optional[FileExporter] = None, service_name: str = "pageless"):
+        self.exporter = exporter
+        self.service_name = service_name
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """Start a child of the current span
+
+        Used as a context manager the span is current while the block runs;
+        otherwise it stays a leaf and the caller calls ``end()``.
+        """
+        if self.exporter is None:
+            return NULL_SPAN
+        return Span(self, name, _current.get(), attributes)
+
+    def export(self, span: Span, end_ns: int, error: Optional[BaseException]) -> None:
+        record = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [_attribute("service.name", self.service_name)]
+            + [_attribute(key, value) for key, value in span.attributes.items()],
+            "status": {"code": STATUS_OK} if error is None else {"code": STATUS_ERROR, "message": repr(error)},
+        }
+        if span.parent_id is not None:
+            record["parentSpanId"] = span.parent_id
+        # Flush once a whole trace is done rather than per span
+        self.exporter.export(record, flush=span.parent_id is None)
+
+    def http_trace(self) -> Callable[[str, Dict[str, Any]], Any]:
+        """httpcore ``trace`` extension callback turning connection phases into child spans
+
+        Phases include connection.connect_tcp (DNS and TCP), connection.start_tls,
+        http11/http2 send_request_headers, receive_response_headers and
+        receive_response_body.
+        """
+        open_spans: Dict[str, Any] = {}
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            phase, _, state = event_name.rpartition(".")
+            if state == "started":
+                open_spans[phase] = self.span(phase)
+            elif phase in open_spans:
+                open_spans.pop(phase).end(info.get("exception") if state == "failed" else None)
+
+        return trace
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()